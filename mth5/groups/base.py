@@ -33,7 +33,7 @@ from mt_metadata.base import Base
 
 from mth5.helpers import get_tree, validate_name
 from mth5.utils.exceptions import MTH5Error
-from mth5.helpers import to_numpy_type, from_numpy_type
+from mth5.helpers import from_numpy_type, write_attributes
 
 # make a dictionary of available metadata classes
 meta_classes = dict(inspect.getmembers(metadata, inspect.isclass))
@@ -247,10 +247,9 @@ class BaseGroup:
         """
 
         try:
-            for key, value in self.metadata.to_dict(single=True).items():
-                value = to_numpy_type(value)
-                self.logger.debug(f"wrote metadata {key} = {value}")
-                self.hdf5_group.attrs.create(key, value)
+            write_attributes(
+                self.hdf5_group, self.metadata.to_dict(single=True)
+            )
         except KeyError as key_error:
             if "no write intent" in str(key_error):
                 self.logger.warning(
@@ -281,6 +280,7 @@ class BaseGroup:
         group_class,
         group_metadata=None,
         match="id",
+        **kwargs,
     ):
         """
         Add a group
@@ -292,6 +292,7 @@ class BaseGroup:
         :type name: string
         :param station_metadata: Station metadata container, defaults to None
         :type station_metadata: :class:`mth5.metadata.Station`, optional
+        :param kwargs: extra keywords passed on to `group_class`
         :return: A convenience class for the added station
         :rtype: :class:`mth5_groups.StationGroup`
 
@@ -309,7 +310,9 @@ class BaseGroup:
                     self.logger.error(msg)
                     raise MTH5Error(msg)
             new_group = self.hdf5_group.create_group(name)
-            return_obj = group_class(new_group, **self.dataset_options)
+            return_obj = group_class(
+                new_group, **self.dataset_options, **kwargs
+            )
             if group_metadata is None:
                 return_obj._metadata.set_attr_from_name(match, name)
             else:
@@ -329,15 +332,16 @@ class BaseGroup:
                     "returning existing group."
                 )
                 self.logger.info(msg)
-                return_obj = self._get_group(name, group_class)
+                return_obj = self._get_group(name, group_class, **kwargs)
         return return_obj
 
-    def _get_group(self, name, group_class):
+    def _get_group(self, name, group_class, **kwargs):
         """
         Get a group with the same name as name
 
         :param name: existing group name
         :type station_name: string
+        :param kwargs: extra keywords passed on to `group_class`
         :return: convenience name class
         :rtype: group_class
         :raises MTH5Error:  if the name is not found.
@@ -346,7 +350,9 @@ class BaseGroup:
         name = validate_name(name)
         try:
             # get the group and be sure to read the metadata
-            group = group_class(self.hdf5_group[name], **self.dataset_options)
+            group = group_class(
+                self.hdf5_group[name], **self.dataset_options, **kwargs
+            )
             group.read_metadata()
             return group
         except KeyError:
@@ -26,9 +26,9 @@ from mth5 import CHANNEL_DTYPE
 from mth5.utils.exceptions import MTH5Error
 from mth5.groups import FiltersGroup
 from mth5.helpers import (
-    to_numpy_type,
     from_numpy_type,
     inherit_doc_string,
+    write_attributes,
 )
 
 from mth5.timeseries import ChannelTS
@@ -323,9 +323,7 @@ class ChannelDataset:
 
         """
         meta_dict = self.metadata.to_dict()[self.metadata._class_name.lower()]
-        for key, value in meta_dict.items():
-            value = to_numpy_type(value)
-            self.hdf5_dataset.attrs.create(key, value)
+        write_attributes(self.hdf5_dataset, meta_dict)
 
     def replace_dataset(self, new_data_array):
         """
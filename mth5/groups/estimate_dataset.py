@@ -18,7 +18,7 @@ from loguru import logger
 from mt_metadata.transfer_functions.tf import StatisticalEstimate
 
 from mth5.utils.exceptions import MTH5Error
-from mth5.helpers import to_numpy_type
+from mth5.helpers import write_attributes
 
 # =============================================================================
 
@@ -150,9 +150,7 @@ class EstimateDataset:
 
         """
         meta_dict = self.metadata.to_dict()[self.metadata._class_name.lower()]
-        for key, value in meta_dict.items():
-            value = to_numpy_type(value)
-            self.hdf5_dataset.attrs.create(key, value)
+        write_attributes(self.hdf5_dataset, meta_dict)
 
     def replace_dataset(self, new_data_array):
         """
@@ -75,7 +75,8 @@ class ExperimentGroup(BaseGroup):
     """
 
     def __init__(self, group, **kwargs):
-
+        # samples per chunk of new channels, passed on to surveys
+        self.chunk_size = None
         super().__init__(group, **kwargs)
 
     @BaseGroup.metadata.getter
@@ -97,4 +98,8 @@ class ExperimentGroup(BaseGroup):
 
     @property
     def surveys_group(self):
-        return MasterSurveyGroup(self.hdf5_group["Surveys"])
+        return MasterSurveyGroup(
+            self.hdf5_group["Surveys"],
+            chunk_size=self.chunk_size,
+            **self.dataset_options,
+        )
@@ -16,7 +16,7 @@ import xarray as xr
 from loguru import logger
 
 from mth5.utils.exceptions import MTH5Error
-from mth5.helpers import to_numpy_type
+from mth5.helpers import write_attributes
 from mth5.timeseries.ts_helpers import make_dt_coordinates
 
 from mt_metadata.transfer_functions.processing.fourier_coefficients import (
@@ -185,9 +185,7 @@ class FCChannelDataset:
 
         """
         meta_dict = self.metadata.to_dict()[self.metadata._class_name.lower()]
-        for key, value in meta_dict.items():
-            value = to_numpy_type(value)
-            self.hdf5_dataset.attrs.create(key, value)
+        write_attributes(self.hdf5_dataset, meta_dict)
 
     @property
     def n_windows(self):
@@ -15,6 +15,7 @@ Created on Wed Jun  9 08:58:15 2021
 from mt_metadata.timeseries.filters import CoefficientFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import get_member_addresses
 
 # =============================================================================
 #  COEFFCIENT Group
@@ -28,25 +29,34 @@ class CoefficientGroup(BaseGroup):
 
     def __init__(self, group, **kwargs):
         super().__init__(group, **kwargs)
+        self._filter_dict = None
+        self._filter_addresses = None
 
     @property
     def filter_dict(self):
         """
 
-        Dictionary of available coefficient filters
+        Dictionary of available coefficient filters, cached until filters in
+        the file are added, removed or replaced
 
         :return: DESCRIPTION
         :rtype: TYPE
         """
-        f_dict = {}
-        for key in self.hdf5_group.keys():
-            coefficient_group = self.hdf5_group[key]
-            f_dict[key] = {
-                "type": coefficient_group.attrs["type"],
-                "hdf5_ref": coefficient_group.ref,
-            }
-
-        return f_dict
+        # an updated filter is deleted and made again under the same
+        # name, so check the object addresses as well as the names.
+        # This also picks up changes made through another group object.
+        addresses = get_member_addresses(self.hdf5_group)
+        if self._filter_dict is None or addresses != self._filter_addresses:
+            f_dict = {}
+            for key, coefficient_group in self.hdf5_group.items():
+                f_dict[key] = {
+                    "type": coefficient_group.attrs.get("type"),
+                    "hdf5_ref": coefficient_group.ref,
+                }
+            self._filter_dict = f_dict
+            self._filter_addresses = addresses
+
+        return self._filter_dict
 
     def add_filter(self, name, coefficient_metadata):
         """
@@ -114,6 +124,6 @@ class CoefficientGroup(BaseGroup):
 
         coefficient_group = self.get_filter(name)
 
-        coefficient_obj = CoefficientFilter(**coefficient_group.attrs)
+        coefficient_obj = CoefficientFilter(**dict(coefficient_group.attrs))
 
         return coefficient_obj
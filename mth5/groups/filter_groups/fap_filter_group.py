@@ -17,6 +17,19 @@ import numpy as np
 from mt_metadata.timeseries.filters import FrequencyResponseTableFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import get_filter_chunks, get_member_addresses
+
+# =============================================================================
+# Data types
+# =============================================================================
+# frequency, amplitude and phase table at the default double precision
+_FAP_DTYPE = np.dtype(
+    [
+        ("frequency", np.float64),
+        ("amplitude", np.float64),
+        ("phase", np.float64),
+    ]
+)
 
 # =============================================================================
 # fap Group
@@ -28,33 +41,55 @@ class FAPGroup(BaseGroup):
     """
 
     def __init__(self, group, **kwargs):
+        # chunk shape for filter datasets, None to estimate from the size
+        self.chunks = None
         super().__init__(group, **kwargs)
+        self._filter_dict = None
+        self._filter_addresses = None
 
     @property
     def filter_dict(self):
         """
 
-        Dictionary of available fap filters
+        Dictionary of available fap filters, cached until filters in
+        the file are added, removed or replaced
 
         :return: DESCRIPTION
         :rtype: TYPE
 
         """
-        f_dict = {}
-        for key in self.hdf5_group.keys():
-            fap_group = self.hdf5_group[key]
-            f_dict[key] = {
-                "type": fap_group.attrs["type"],
-                "hdf5_ref": fap_group.ref,
-            }
-
-        return f_dict
-
-    def add_filter(self, name, frequency, amplitude, phase, fap_metadata):
+        # an updated filter is deleted and made again under the same
+        # name, so check the object addresses as well as the names.
+        # This also picks up changes made through another group object.
+        addresses = get_member_addresses(self.hdf5_group)
+        if self._filter_dict is None or addresses != self._filter_addresses:
+            f_dict = {}
+            for key, fap_group in self.hdf5_group.items():
+                f_dict[key] = {
+                    "type": fap_group.attrs.get("type"),
+                    "hdf5_ref": fap_group.ref,
+                }
+            self._filter_dict = f_dict
+            self._filter_addresses = addresses
+
+        return self._filter_dict
+
+    def add_filter(
+        self,
+        name,
+        frequency,
+        amplitude,
+        phase,
+        fap_metadata,
+        precision=np.float64,
+    ):
         """
 
         create an HDF5 group/dataset from information given.
-        
+
+        Frequency, amplitude and phase are stored together in the compound
+        dataset "fap_table".
+
         :param name: name of the filter
         :type name: string
         :param frequency: frequency array in samples per second
@@ -67,26 +102,55 @@ class FAPGroup(BaseGroup):
         :class:`mt_metadata.timeseries.filters.FrequencyResponseTableFilter` \
          for details on entries
         :type fap_metadata: dictionary
-        :return: DESCRIPTION
-        :rtype: TYPE
+        :param precision: data type used to store amplitude and phase,
+         np.float32 halves the size of the table on disk if single precision
+         is sufficient.  Frequency is always stored as np.float64 to keep the
+         full dynamic range, defaults to np.float64
+        :type precision: np.dtype, optional
+        :return: HDF5 group of the filter
+        :rtype: :class:`h5py.Group`
+        :raises ValueError: if frequency, amplitude and phase are not the
+         same shape
 
         """
 
+        frequency = np.ascontiguousarray(frequency, dtype=np.float64)
+        amplitude = np.ascontiguousarray(amplitude, dtype=precision)
+        phase = np.ascontiguousarray(phase, dtype=precision)
+        if not frequency.shape == amplitude.shape == phase.shape:
+            msg = (
+                f"frequency {frequency.shape}, amplitude {amplitude.shape} "
+                f"and phase {phase.shape} must have the same shape"
+            )
+            self.logger.error(msg)
+            raise ValueError(msg)
+
         # create a group for the filter by the name
         fap_filter_group = self.hdf5_group.create_group(name)
 
-        # create datasets for the poles and zeros
-        fap_ds = fap_filter_group.create_dataset(
+        fap_dtype = _FAP_DTYPE
+        if amplitude.dtype != np.float64:
+            fap_dtype = np.dtype(
+                [
+                    ("frequency", np.float64),
+                    ("amplitude", amplitude.dtype),
+                    ("phase", amplitude.dtype),
+                ]
+            )
+        # fill the table a column at a time, not from a list of tuples
+        fap_table = np.empty(frequency.shape, dtype=fap_dtype)
+        fap_table["frequency"] = frequency
+        fap_table["amplitude"] = amplitude
+        fap_table["phase"] = phase
+        fap_filter_group.create_dataset(
             "fap_table",
-            frequency.shape,
-            dtype=np.dtype(
-                [("frequency", float), ("amplitude", float), ("phase", float)]
+            data=fap_table,
+            chunks=get_filter_chunks(
+                fap_table.size, fap_table.dtype.itemsize, chunks=self.chunks
             ),
             **self.dataset_options,
         )
 
-        fap_ds[:] = [(f, a, p) for f, a, p in zip(frequency, amplitude, phase)]
-
         # fill in the metadata
         fap_filter_group.attrs.update(fap_metadata)
 
@@ -166,21 +230,18 @@ class FAPGroup(BaseGroup):
         fap_obj = FrequencyResponseTableFilter(**fap_group.attrs)
 
         try:
-            fap_obj.frequencies = fap_group["fap_table"]["frequency"][:]
-        except TypeError:
-            self.logger.debug(f"fap filter {name} has no frequency")
+            # read the whole table once and split the fields in memory,
+            # reading each field would decompress every chunk 3 times.
+            fap_ds = fap_group["fap_table"]
+            fap_table = np.empty(fap_ds.shape, dtype=fap_ds.dtype)
+            fap_ds.read_direct(fap_table)
+            fap_obj.frequencies = fap_table["frequency"]
+            fap_obj.amplitudes = fap_table["amplitude"]
+            fap_obj.phases = fap_table["phase"]
+        except (KeyError, TypeError):
+            self.logger.debug(f"fap filter {name} has no frequency table")
             fap_obj.frequencies = []
-
-        try:
-            fap_obj.amplitudes = fap_group["fap_table"]["amplitude"][:]
-        except TypeError:
-            self.logger.debug(f"fap filter {name} has no amplitudes")
             fap_obj.amplitudes = []
-
-        try:
-            fap_obj.phases = fap_group["fap_table"]["phase"][:]
-        except TypeError:
-            self.logger.debug(f"fap filter {name} has no phases")
             fap_obj.phases = []
 
         return fap_obj
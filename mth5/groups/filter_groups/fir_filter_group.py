@@ -17,6 +17,7 @@ Created on Wed Jun  9 08:55:16 2021
 from mt_metadata.timeseries.filters import FIRFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import get_member_addresses
 
 # =============================================================================
 # fir Group
@@ -29,25 +30,34 @@ class FIRGroup(BaseGroup):
 
     def __init__(self, group, **kwargs):
         super().__init__(group, **kwargs)
+        self._filter_dict = None
+        self._filter_addresses = None
 
     @property
     def filter_dict(self):
         """
 
-        Dictionary of available fir filters
+        Dictionary of available fir filters, cached until filters in
+        the file are added, removed or replaced
 
         :return: DESCRIPTION
         :rtype: TYPE
         """
-        f_dict = {}
-        for key in self.hdf5_group.keys():
-            fir_group = self.hdf5_group[key]
-            f_dict[key] = {
-                "type": fir_group.attrs["type"],
-                "hdf5_ref": fir_group.ref,
-            }
-
-        return f_dict
+        # an updated filter is deleted and made again under the same
+        # name, so check the object addresses as well as the names.
+        # This also picks up changes made through another group object.
+        addresses = get_member_addresses(self.hdf5_group)
+        if self._filter_dict is None or addresses != self._filter_addresses:
+            f_dict = {}
+            for key, fir_group in self.hdf5_group.items():
+                f_dict[key] = {
+                    "type": fir_group.attrs.get("type"),
+                    "hdf5_ref": fir_group.ref,
+                }
+            self._filter_dict = f_dict
+            self._filter_addresses = addresses
+
+        return self._filter_dict
 
     def add_filter(self, name, coefficients, fir_metadata):
         """
@@ -133,7 +143,7 @@ class FIRGroup(BaseGroup):
 
         fir_group = self.get_filter(name)
 
-        fir_obj = FIRFilter(**fir_group.attrs)
+        fir_obj = FIRFilter(**dict(fir_group.attrs))
 
         try:
             fir_obj.coefficients = fir_group["coefficients"][:]
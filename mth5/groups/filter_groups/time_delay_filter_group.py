@@ -15,6 +15,7 @@ Created on Wed Jun  9 09:01:55 2021
 from mt_metadata.timeseries.filters import TimeDelayFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import get_member_addresses
 
 # =============================================================================
 # TimeDelay Group
@@ -29,39 +30,44 @@ class TimeDelayGroup(BaseGroup):
 
     def __init__(self, group, **kwargs):
         super().__init__(group, **kwargs)
+        self._filter_dict = None
+        self._filter_addresses = None
 
     @property
     def filter_dict(self):
         """
 
-        Dictionary of available time_delay filters
+        Dictionary of available time_delay filters, cached until filters in
+        the file are added, removed or replaced
 
         :return: DESCRIPTION
         :rtype: TYPE
 
         """
-        f_dict = {}
-        for key in self.hdf5_group.keys():
-            time_delay_group = self.hdf5_group[key]
-            f_dict[key] = {
-                "type": time_delay_group.attrs["type"],
-                "hdf5_ref": time_delay_group.ref,
-            }
-
-        return f_dict
+        # an updated filter is deleted and made again under the same
+        # name, so check the object addresses as well as the names.
+        # This also picks up changes made through another group object.
+        addresses = get_member_addresses(self.hdf5_group)
+        if self._filter_dict is None or addresses != self._filter_addresses:
+            f_dict = {}
+            for key, time_delay_group in self.hdf5_group.items():
+                f_dict[key] = {
+                    "type": time_delay_group.attrs.get("type"),
+                    "hdf5_ref": time_delay_group.ref,
+                }
+            self._filter_dict = f_dict
+            self._filter_addresses = addresses
+
+        return self._filter_dict
 
     def add_filter(self, name, time_delay_metadata):
         """
         create an HDF5 group/dataset from information given.
 
-        :param name: Nane of the filter
+        :param name: Name of the filter
         :type name: string
-        :param poles: poles of the filter as complex numbers
-        :type poles: np.ndarray(dtype=complex)
-        :param zeros: zeros of the filter as complex numbers
-        :type zeros: np.ndarray(dtype=comples)
         :param time_delay_metadata: metadata dictionary see
-        :class:`mt_metadata.timeseries.filters.PoleZeroFilter` for details on entries
+        :class:`mt_metadata.timeseries.filters.TimeDelayFilter` for details on entries
         :type time_delay_metadata: dictionary
 
         """
@@ -89,10 +95,10 @@ class TimeDelayGroup(BaseGroup):
 
     def from_object(self, time_delay_object):
         """
-        make a filter from a :class:`mt_metadata.timeseries.filters.PoleZeroFilter`
+        make a filter from a :class:`mt_metadata.timeseries.filters.TimeDelayFilter`
 
-        :param time_delay_object: MT metadata PoleZeroFilter
-        :type time_delay_object: :class:`mt_metadata.timeseries.filters.PoleZeroFilter`
+        :param time_delay_object: MT metadata TimeDelayFilter
+        :type time_delay_object: :class:`mt_metadata.timeseries.filters.TimeDelayFilter`
 
         """
 
@@ -114,15 +120,17 @@ class TimeDelayGroup(BaseGroup):
 
     def to_object(self, name):
         """
-        make a :class:`mt_metadata.timeseries.filters.pole_zeros_filter` object
+        make a :class:`mt_metadata.timeseries.filters.TimeDelayFilter` object
 
-        :return: DESCRIPTION
-        :rtype: TYPE
+        :param name: name of the filter
+        :type name: string
+        :return: MT metadata TimeDelayFilter
+        :rtype: :class:`mt_metadata.timeseries.filters.TimeDelayFilter`
 
         """
 
         time_delay_group = self.get_filter(name)
 
-        time_delay_obj = TimeDelayFilter(**time_delay_group.attrs)
+        time_delay_obj = TimeDelayFilter(**dict(time_delay_group.attrs))
 
         return time_delay_obj
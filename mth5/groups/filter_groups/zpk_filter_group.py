@@ -12,9 +12,20 @@ Created on Wed Jun  9 08:55:16 2021
 # =============================================================================
 # Imports
 # =============================================================================
+import numpy as np
+
 from mt_metadata.timeseries.filters import PoleZeroFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import get_filter_chunks, get_member_addresses
+
+# =============================================================================
+# Data types
+# =============================================================================
+# poles and zeros are stored as native complex values
+_COMPLEX_DTYPE = np.dtype(np.complex128)
+# older files store poles and zeros as a compound of real and imaginary parts
+_COMPLEX_COMPOUND_DTYPE = np.dtype([("real", "<f8"), ("imag", "<f8")])
 
 # =============================================================================
 # ZPK Group
@@ -26,27 +37,38 @@ class ZPKGroup(BaseGroup):
     """
 
     def __init__(self, group, **kwargs):
+        # chunk shape for filter datasets, None to estimate from the size
+        self.chunks = None
         super().__init__(group, **kwargs)
+        self._filter_dict = None
+        self._filter_addresses = None
 
     @property
     def filter_dict(self):
         """
 
-        Dictionary of available ZPK filters
+        Dictionary of available ZPK filters, cached until filters in
+        the file are added, removed or replaced
 
         :return: DESCRIPTION
         :rtype: TYPE
 
         """
-        f_dict = {}
-        for key in self.hdf5_group.keys():
-            zpk_group = self.hdf5_group[key]
-            f_dict[key] = {
-                "type": zpk_group.attrs["type"],
-                "hdf5_ref": zpk_group.ref,
-            }
-
-        return f_dict
+        # an updated filter is deleted and made again under the same
+        # name, so check the object addresses as well as the names.
+        # This also picks up changes made through another group object.
+        addresses = get_member_addresses(self.hdf5_group)
+        if self._filter_dict is None or addresses != self._filter_addresses:
+            f_dict = {}
+            for key, zpk_group in self.hdf5_group.items():
+                f_dict[key] = {
+                    "type": zpk_group.attrs.get("type"),
+                    "hdf5_ref": zpk_group.ref,
+                }
+            self._filter_dict = f_dict
+            self._filter_addresses = addresses
+
+        return self._filter_dict
 
     def add_filter(self, name, poles, zeros, zpk_metadata):
         """
@@ -70,13 +92,19 @@ class ZPKGroup(BaseGroup):
         poles_ds = zpk_filter_group.create_dataset(
             "poles",
             poles.shape,
-            dtype=complex,
+            dtype=_COMPLEX_DTYPE,
+            chunks=get_filter_chunks(
+                poles.size, _COMPLEX_DTYPE.itemsize, chunks=self.chunks
+            ),
             **self.dataset_options,
         )
         zeros_ds = zpk_filter_group.create_dataset(
             "zeros",
             zeros.shape,
-            dtype=complex,
+            dtype=_COMPLEX_DTYPE,
+            chunks=get_filter_chunks(
+                zeros.size, _COMPLEX_DTYPE.itemsize, chunks=self.chunks
+            ),
             **self.dataset_options,
         )
 
@@ -143,38 +171,50 @@ class ZPKGroup(BaseGroup):
 
         zpk_group = self.get_filter(name)
 
-        zpk_obj = PoleZeroFilter(**zpk_group.attrs)
-
-        if "poles" in zpk_group.keys():
-            if zpk_group["poles"].dtype == complex:
-                zpk_obj.poles = zpk_group["poles"][:]
-            elif "real" in zpk_group["poles"].dtype.names:
-                zpk_obj.poles = (
-                    zpk_group["poles"][()]["real"]
-                    + 1j * zpk_group["poles"][()]["imag"]
-                )
-            else:
-                raise ValueError(
-                    f"Cannot convert values to complex valued poles, check filter {name}"
-                )
-        else:
-            self.logger.debug(f"ZPK filter {name} has no poles")
-            zpk_obj.poles = []
-
-        if "zeros" in zpk_group.keys():
-            if zpk_group["zeros"].dtype == complex:
-                zpk_obj.zeros = zpk_group["zeros"][:]
-            elif "real" in zpk_group["zeros"].dtype.names:
-                zpk_obj.zeros = (
-                    zpk_group["zeros"][()]["real"]
-                    + 1j * zpk_group["zeros"][()]["imag"]
-                )
-            else:
-                raise ValueError(
-                    f"Cannot convert values to complex valued zeros, check filter {name}"
-                )
-        else:
-            self.logger.debug(f"ZPK filter {name} has no zeros")
-            zpk_obj.zeros = []
+        zpk_obj = PoleZeroFilter(**dict(zpk_group.attrs))
+        zpk_obj.poles = self._read_complex(zpk_group, "poles", name)
+        zpk_obj.zeros = self._read_complex(zpk_group, "zeros", name)
 
         return zpk_obj
+
+    def _read_complex(self, zpk_group, key, name):
+        """
+        Read poles or zeros as a complex array.
+
+        Older files store complex values as a compound dataset with fields
+        "real" and "imag".  The dataset is read once with `read_direct` into
+        a buffer of the stored type, rather than reading each field from the
+        file separately.  If the fields are little endian float64 the buffer
+        is viewed as complex128, otherwise the fields are copied into a
+        complex array.
+
+        :param zpk_group: HDF5 group of the ZPK filter
+        :type zpk_group: :class:`h5py.Group`
+        :param key: dataset name, either "poles" or "zeros"
+        :type key: string
+        :param name: name of the filter, used for messages
+        :type name: string
+        :return: complex values, or an empty list if the dataset is missing
+        :rtype: np.ndarray(dtype=complex)
+
+        """
+        if key not in zpk_group.keys():
+            self.logger.debug(f"ZPK filter {name} has no {key}")
+            return []
+
+        dataset = zpk_group[key]
+        values = np.empty(dataset.shape, dtype=dataset.dtype)
+        dataset.read_direct(values)
+        if values.dtype == _COMPLEX_DTYPE:
+            return values
+        elif values.dtype == _COMPLEX_COMPOUND_DTYPE:
+            # same memory layout as complex128, no copy needed
+            return values.view(_COMPLEX_DTYPE)
+        elif values.dtype.names is not None and "real" in values.dtype.names:
+            complex_values = np.empty(values.shape, dtype=_COMPLEX_DTYPE)
+            complex_values.real = values["real"]
+            complex_values.imag = values["imag"]
+            return complex_values
+        raise ValueError(
+            f"Cannot convert values to complex valued {key}, check filter {name}"
+        )
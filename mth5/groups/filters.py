@@ -15,7 +15,6 @@ Need to make a group for FAP and FIR filters.
 # =============================================================================
 # Imports
 # =============================================================================
-
 from mth5.groups.base import BaseGroup
 from mth5.groups.filter_groups import (
     ZPKGroup,
@@ -32,50 +31,122 @@ from mth5.groups.filter_groups import (
 
 class FiltersGroup(BaseGroup):
     """
-    Not implemented yet
+    Container for all filters, sorted by filter type into sub-groups.
     """
 
+    # map filter type to the attribute name of the group that stores it
+    _TYPE_DISPATCH = {
+        "zpk": "zpk_group",
+        "poles_zeros": "zpk_group",
+        "coefficient": "coefficient_group",
+        "time_delay": "time_delay_group",
+        "time delay": "time_delay_group",
+        "fap": "fap_group",
+        "frequency response table": "fap_group",
+        "fir": "fir_group",
+    }
+
+    # attribute names of the filter type groups
+    _GROUP_NAMES = (
+        "zpk_group",
+        "coefficient_group",
+        "time_delay_group",
+        "fap_group",
+        "fir_group",
+    )
+
     def __init__(self, group, **kwargs):
+        self._zpk_group = None
+        self._coefficient_group = None
+        self._time_delay_group = None
+        self._fap_group = None
+        self._fir_group = None
+        # chunk shape for filter datasets, None to estimate from the size
+        self.chunks = None
         super().__init__(group, **kwargs)
 
-        try:
-            self.zpk_group = ZPKGroup(self.hdf5_group.create_group("zpk"))
-        except ValueError:
-            self.zpk_group = ZPKGroup(self.hdf5_group["zpk"])
-        try:
-            self.coefficient_group = CoefficientGroup(
-                self.hdf5_group.create_group("coefficient")
+    def initialize_group(self, **kwargs):
+        """
+        Create the filter type groups and write metadata.  The groups are
+        otherwise only created when first accessed.
+        """
+        # each filter type group is created in the file on first access
+        for name in self._GROUP_NAMES:
+            group = getattr(self, name)
+            self.logger.debug(f"Initialized {group.hdf5_group.name}")
+        super().initialize_group(**kwargs)
+
+    @property
+    def dataset_options(self):
+        """Dataset options passed on to the filter type groups"""
+        options = super().dataset_options
+        if self.chunks is not None:
+            options["chunks"] = self.chunks
+        return options
+
+    @property
+    def zpk_group(self):
+        """Container for pole-zero filters, created on first access"""
+        if self._zpk_group is None:
+            self._zpk_group = ZPKGroup(
+                self.hdf5_group.require_group("zpk"),
+                **self.dataset_options,
             )
-        except ValueError:
-            self.coefficient_group = CoefficientGroup(
-                self.hdf5_group["coefficient"]
+        return self._zpk_group
+
+    @property
+    def coefficient_group(self):
+        """Container for coefficient filters, created on first access"""
+        if self._coefficient_group is None:
+            self._coefficient_group = CoefficientGroup(
+                self.hdf5_group.require_group("coefficient"),
+                **self.dataset_options,
             )
-        try:
-            self.time_delay_group = TimeDelayGroup(
-                self.hdf5_group.create_group("time_delay")
+        return self._coefficient_group
+
+    @property
+    def time_delay_group(self):
+        """Container for time delay filters, created on first access"""
+        if self._time_delay_group is None:
+            self._time_delay_group = TimeDelayGroup(
+                self.hdf5_group.require_group("time_delay"),
+                **self.dataset_options,
             )
-        except ValueError:
-            self.time_delay_group = TimeDelayGroup(
-                self.hdf5_group["time_delay"]
+        return self._time_delay_group
+
+    @property
+    def fap_group(self):
+        """Container for FAP filters, created on first access"""
+        if self._fap_group is None:
+            self._fap_group = FAPGroup(
+                self.hdf5_group.require_group("fap"),
+                **self.dataset_options,
             )
-        try:
-            self.fap_group = FAPGroup(self.hdf5_group.create_group("fap"))
-        except ValueError:
-            self.fap_group = FAPGroup(self.hdf5_group["fap"])
-        try:
-            self.fir_group = FIRGroup(self.hdf5_group.create_group("fir"))
-        except ValueError:
-            self.fir_group = FIRGroup(self.hdf5_group["fir"])
+        return self._fap_group
+
+    @property
+    def fir_group(self):
+        """Container for FIR filters, created on first access"""
+        if self._fir_group is None:
+            self._fir_group = FIRGroup(
+                self.hdf5_group.require_group("fir"),
+                **self.dataset_options,
+            )
+        return self._fir_group
+
+    @property
+    def _filter_groups(self):
+        return [getattr(self, name) for name in self._GROUP_NAMES]
 
     @property
     def filter_dict(self):
+        """
+        Dictionary of all filters, merged from the cached dictionaries of
+        the filter groups on each access so it is never out of date.
+        """
         filter_dict = {}
-        filter_dict.update(self.zpk_group.filter_dict)
-        filter_dict.update(self.coefficient_group.filter_dict)
-        filter_dict.update(self.time_delay_group.filter_dict)
-        filter_dict.update(self.fap_group.filter_dict)
-        filter_dict.update(self.fir_group.filter_dict)
-
+        for group in self._filter_groups:
+            filter_dict.update(group.filter_dict)
         return filter_dict
 
     def add_filter(self, filter_object):
@@ -93,38 +164,41 @@ class FiltersGroup(BaseGroup):
 
         """
         self.logger.debug(f"Type of filter {type(filter_object)}")
-        filter_object.name = filter_object.name.replace("/", " per ")
-
-        if filter_object.type in ["zpk", "poles_zeros"]:
-            try:
-                return self.zpk_group.from_object(filter_object)
-            except ValueError:
-                self.logger.debug(f"group {filter_object.name} already exists")
-                return self.zpk_group.get_filter(filter_object.name)
-        elif filter_object.type in ["coefficient"]:
-            try:
-                return self.coefficient_group.from_object(filter_object)
-            except ValueError:
-                self.logger.debug(f"group {filter_object.name} already exists")
-                return self.coefficient_group.get_filter(filter_object.name)
-        elif filter_object.type in ["time_delay", "time delay"]:
-            try:
-                return self.time_delay_group.from_object(filter_object)
-            except ValueError:
-                self.logger.debug(f"group {filter_object.name} already exists")
-                return self.time_delay_group.get_filter(filter_object.name)
-        elif filter_object.type in ["fap", "frequency response table"]:
-            try:
-                return self.fap_group.from_object(filter_object)
-            except ValueError:
-                self.logger.debug(f"group {filter_object.name} already exists")
-                return self.fap_group.get_filter(filter_object.name)
-        elif filter_object.type in ["fir"]:
-            try:
-                return self.fir_group.from_object(filter_object)
-            except ValueError:
-                self.logger.debug(f"group {filter_object.name} already exists")
-                return self.fir_group.get_filter(filter_object.name)
+        # "/" is a path separator in HDF5, the sanitized name is kept on
+        # the filter object so it is only replaced once.
+        if "/" in filter_object.name:
+            filter_object.name = filter_object.name.replace("/", " per ")
+
+        try:
+            group = getattr(self, self._TYPE_DISPATCH[filter_object.type])
+        except KeyError:
+            self.logger.warning(
+                f"Filter type {filter_object.type} is not supported"
+            )
+            return
+
+        if filter_object.name in group.hdf5_group:
+            self.logger.debug(f"group {filter_object.name} already exists")
+            return group.get_filter(filter_object.name)
+        return group.from_object(filter_object)
+
+    def add_filters(self, filter_objects):
+        """
+        Add many filters at once.
+
+        Each filter is added with :meth:`add_filter` using the same filter
+        groups.  Use :meth:`add_filter` for a single filter.
+
+        :param filter_objects: MT metadata filter objects
+        :type filter_objects: iterable of
+         :class:`mt_metadata.timeseries.filters`
+        :return: HDF5 groups of the filters
+        :rtype: list
+
+        """
+        return [
+            self.add_filter(filter_object) for filter_object in filter_objects
+        ]
 
     def get_filter(self, name):
         """
@@ -150,13 +224,9 @@ class FiltersGroup(BaseGroup):
             msg = f"Could not find {name} in the filter dictionary"
             self.logger.error(msg)
             raise KeyError(msg, name)
-        if f_type in ["zpk"]:
-            return self.zpk_group.to_object(name)
-        elif f_type in ["coefficient"]:
-            return self.coefficient_group.to_object(name)
-        elif f_type in ["time_delay", "time delay"]:
-            return self.time_delay_group.to_object(name)
-        elif f_type in ["fap", "frequency response table"]:
-            return self.fap_group.to_object(name)
-        elif f_type in ["fir"]:
-            return self.fir_group.to_object(name)
+        try:
+            group = getattr(self, self._TYPE_DISPATCH[f_type])
+        except KeyError:
+            self.logger.warning(f"Filter type {f_type} is not supported")
+            return
+        return group.to_object(name)
@@ -26,9 +26,10 @@ from mth5.groups import (
 )
 from mth5.utils.exceptions import MTH5Error
 from mth5.helpers import (
-    to_numpy_type,
     from_numpy_type,
     validate_name,
+    get_time_series_chunks,
+    write_attributes,
 )
 
 from mth5.timeseries import ChannelTS, RunTS
@@ -199,6 +200,8 @@ class RunGroup(BaseGroup):
     """
 
     def __init__(self, group, run_metadata=None, **kwargs):
+        # samples per chunk of new channels, None sizes chunks to ~1 MiB
+        self.chunk_size = None
         super().__init__(group, group_metadata=run_metadata, **kwargs)
 
     @property
@@ -300,9 +303,7 @@ class RunGroup(BaseGroup):
 
         """
 
-        for key, value in self.metadata.to_dict(single=True).items():
-            value = to_numpy_type(value)
-            self.hdf5_group.attrs.create(key, value)
+        write_attributes(self.hdf5_group, self.metadata.to_dict(single=True))
 
     def add_channel(
         self,
@@ -335,8 +336,10 @@ class RunGroup(BaseGroup):
          given then the data can be extended infinitely (or until memory runs
          out), defaults to (None,)
         :type max_shape: tuple, optional
-        :param chunks: Use chunked storage, defaults to True
-        :type chunks: bool, optional
+        :param chunks: Use chunked storage, if True chunks hold `chunk_size`
+         samples or about 1 MiB if `chunk_size` is None. Can also be a
+         chunk shape, defaults to True
+        :type chunks: bool or tuple, optional
         :param channel_metadata: metadata container, defaults to None
         :type channel_metadata: [ :class:`mth5.metadata.Electric` |
                                  :class:`mth5.metadata.Magnetic` |
@@ -374,6 +377,10 @@ class RunGroup(BaseGroup):
         if data is not None:
             if data.size < 1024:
                 chunks = None
+            elif chunks is True:
+                chunks = get_time_series_chunks(
+                    data.size, data.dtype.itemsize, self.chunk_size
+                )
         try:
             if data is not None:
                 channel_group = self.hdf5_group.create_dataset(
@@ -421,6 +428,14 @@ class RunGroup(BaseGroup):
                         )
                 else:
                     estimate_size = shape
+                if chunks is True:
+                    # the dataset is resized when data is added, so do not
+                    # let a small first guess make for tiny chunks
+                    chunks = get_time_series_chunks(
+                        max(estimate_size[0], CHUNK_SIZE),
+                        np.dtype(channel_dtype).itemsize,
+                        self.chunk_size,
+                    )
                 ## Create the dataset
                 channel_group = self.hdf5_group.create_dataset(
                     channel_name,
@@ -705,7 +720,10 @@ class RunGroup(BaseGroup):
         if channel_ts_obj.channel_response.filters_list != []:
             from mth5.groups import FiltersGroup
 
-            fg = FiltersGroup(self.hdf5_group.parent.parent.parent["Filters"])
+            fg = FiltersGroup(
+                self.hdf5_group.parent.parent.parent["Filters"],
+                **self.dataset_options,
+            )
             for ff in channel_ts_obj.channel_response.filters_list:
                 fg.add_filter(ff)
         ch_obj = self.add_channel(
@@ -153,9 +153,11 @@ class StandardsGroup(BaseGroup):
 
         """
 
+        summary_table = self.summary_table
+        rows = []
         for key, v_dict in summary_dict.items():
             key_list = [key]
-            for dkey in self.summary_table.dtype.names[1:]:
+            for dkey in summary_table.dtype.names[1:]:
                 value = v_dict[dkey]
 
                 if isinstance(value, list):
@@ -166,9 +168,14 @@ class StandardsGroup(BaseGroup):
                 if value is None:
                     value = ""
                 key_list.append(value)
-            key_list = np.array([tuple(key_list)], self.summary_table.dtype)
-            index = self.summary_table.add_row(key_list)
-        self.logger.debug(f"Added {index} rows to Standards Group")
+            rows.append(tuple(key_list))
+
+        # write all rows at once, resizing row by row is slow
+        rows = np.array(rows, dtype=summary_table.dtype)
+        n_rows = summary_table.nrows
+        summary_table.array.resize((n_rows + rows.size,))
+        summary_table.array[n_rows:] = rows
+        self.logger.debug(f"Added {rows.size} rows to Standards Group")
 
     def initialize_group(self):
         """
@@ -170,6 +170,8 @@ class MasterStationGroup(BaseGroup):
     """
 
     def __init__(self, group, **kwargs):
+        # samples per chunk of new channels, passed on to stations
+        self.chunk_size = None
         super().__init__(group, **kwargs)
 
     @property
@@ -261,7 +263,11 @@ class MasterStationGroup(BaseGroup):
             raise Exception("station name is None, do not know what to name it")
 
         return self._add_group(
-            station_name, StationGroup, station_metadata, match="id"
+            station_name,
+            StationGroup,
+            station_metadata,
+            match="id",
+            chunk_size=self.chunk_size,
         )
 
     def get_station(self, station_name):
@@ -287,7 +293,9 @@ class MasterStationGroup(BaseGroup):
         MTH5Error: MT001 does not exist, check station_list for existing names
 
         """
-        return self._get_group(station_name, StationGroup)
+        return self._get_group(
+            station_name, StationGroup, chunk_size=self.chunk_size
+        )
 
     def remove_station(self, station_name):
         """
@@ -478,6 +486,8 @@ class StationGroup(BaseGroup):
             "Transfer_Functions",
             "Fourier_Coefficients",
         ]
+        # samples per chunk of new channels, passed on to runs
+        self.chunk_size = None
         super().__init__(group, group_metadata=station_metadata, **kwargs)
 
     def initialize_group(self, **kwargs):
@@ -505,7 +515,11 @@ class StationGroup(BaseGroup):
     @property
     def master_station_group(self):
         """shortcut to master station group"""
-        return MasterStationGroup(self.hdf5_group.parent)
+        return MasterStationGroup(
+            self.hdf5_group.parent,
+            chunk_size=self.chunk_size,
+            **self.dataset_options,
+        )
 
     @property
     def transfer_functions_group(self):
@@ -691,7 +705,11 @@ class StationGroup(BaseGroup):
         """
 
         return self._add_group(
-            run_name, RunGroup, group_metadata=run_metadata, match="id"
+            run_name,
+            RunGroup,
+            group_metadata=run_metadata,
+            match="id",
+            chunk_size=self.chunk_size,
         )
 
     def get_run(self, run_name):
@@ -707,7 +725,7 @@ class StationGroup(BaseGroup):
 
         """
 
-        return self._get_group(run_name, RunGroup)
+        return self._get_group(run_name, RunGroup, chunk_size=self.chunk_size)
 
     def remove_run(self, run_name):
         """
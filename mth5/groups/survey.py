@@ -25,7 +25,7 @@ from mth5.groups import (
     StandardsGroup,
 )
 from mth5.utils.exceptions import MTH5Error
-from mth5.helpers import validate_name, to_numpy_type
+from mth5.helpers import validate_name, write_attributes
 
 from mt_metadata.timeseries import Survey
 
@@ -136,6 +136,8 @@ class MasterSurveyGroup(BaseGroup):
     """
 
     def __init__(self, group, **kwargs):
+        # samples per chunk of new channels, passed on to surveys
+        self.chunk_size = None
         super().__init__(group, **kwargs)
 
     @property
@@ -273,6 +275,7 @@ class MasterSurveyGroup(BaseGroup):
             survey_obj = SurveyGroup(
                 survey_group,
                 survey_metadata=survey_metadata,
+                chunk_size=self.chunk_size,
                 **self.dataset_options,
             )
             survey_obj.initialize_group()
@@ -309,7 +312,9 @@ class MasterSurveyGroup(BaseGroup):
 
         try:
             return SurveyGroup(
-                self.hdf5_group[survey_name], **self.dataset_options
+                self.hdf5_group[survey_name],
+                chunk_size=self.chunk_size,
+                **self.dataset_options,
             )
         except KeyError:
             msg = (
@@ -422,6 +427,8 @@ class SurveyGroup(BaseGroup):
     """
 
     def __init__(self, group, survey_metadata=None, **kwargs):
+        # samples per chunk of new channels, passed on to stations
+        self.chunk_size = None
         super().__init__(group, group_metadata=survey_metadata, **kwargs)
 
         self._default_subgroup_names = [
@@ -480,10 +487,9 @@ class SurveyGroup(BaseGroup):
         """
 
         try:
-            for key, value in self._metadata.to_dict(single=True).items():
-                value = to_numpy_type(value)
-                self.logger.debug(f"wrote metadata {key} = {value}")
-                self.hdf5_group.attrs.create(key, value)
+            write_attributes(
+                self.hdf5_group, self._metadata.to_dict(single=True)
+            )
             self._has_read_metadata = True
         except KeyError as key_error:
             if "no write intent" in str(key_error):
@@ -502,7 +508,11 @@ class SurveyGroup(BaseGroup):
 
     @property
     def stations_group(self):
-        return MasterStationGroup(self.hdf5_group["Stations"])
+        return MasterStationGroup(
+            self.hdf5_group["Stations"],
+            chunk_size=self.chunk_size,
+            **self.dataset_options,
+        )
 
     @property
     def filters_group(self):
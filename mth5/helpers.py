@@ -91,6 +91,117 @@ def validate_compression(compression, level):
     return compression, level
 
 
+def get_filter_chunks(n_rows, row_bytes, chunk_bytes=65536, chunks=None):
+    """
+    Estimate a chunk shape for a small 1-D filter table.
+
+    Chunks are sized to hold about `chunk_bytes` so the B-tree stays small
+    and a compressed table is read in as few chunks as possible.
+
+    :param n_rows: number of rows in the table
+    :type n_rows: int
+    :param row_bytes: size of a single row in bytes
+    :type row_bytes: int
+    :param chunk_bytes: target size of a chunk in bytes, defaults to 65536
+    :type chunk_bytes: int, optional
+    :param chunks: explicit chunk shape or True, overrides `chunk_bytes`
+     if given.  A chunk shape is clipped to the number of rows, defaults
+     to None
+    :type chunks: tuple, int or bool, optional
+    :return: chunk shape, None for an empty table so h5py decides
+    :rtype: tuple or None
+
+    """
+    if n_rows < 1:
+        return None
+    if chunks is True:
+        return chunks
+    if chunks is not None:
+        return (max(1, min(n_rows, int(np.atleast_1d(chunks)[0]))),)
+    return (max(1, min(n_rows, chunk_bytes // row_bytes)),)
+
+
+def get_time_series_chunks(
+    n_samples, sample_bytes, chunk_size=None, chunk_bytes=2**20
+):
+    """
+    Estimate a chunk shape for a 1-D time series channel.
+
+    Channels are mostly read as long contiguous pieces of time, so chunks
+    are made long, about `chunk_bytes` each, instead of the small chunks
+    h5py guesses.
+
+    :param n_samples: number of samples in the channel
+    :type n_samples: int
+    :param sample_bytes: size of a single sample in bytes
+    :type sample_bytes: int
+    :param chunk_size: number of samples per chunk, overrides
+     `chunk_bytes` if given, defaults to None
+    :type chunk_size: int, optional
+    :param chunk_bytes: target size of a chunk in bytes, defaults to 1 MiB
+    :type chunk_bytes: int, optional
+    :return: chunk shape
+    :rtype: tuple
+
+    """
+    if chunk_size is None:
+        chunk_size = chunk_bytes // sample_bytes
+    return (max(1, min(n_samples, chunk_size)),)
+
+
+def get_member_addresses(group):
+    """
+    Get the name and object address of each member of an HDF5 group.
+
+    The addresses are read from the links without opening the members, so
+    this is a cheap way to tell if members were added, removed or replaced,
+    for instance to check a cache.
+
+    :param group: HDF5 group
+    :type group: :class:`h5py.Group`
+    :return: (name, address) of each member
+    :rtype: tuple
+
+    """
+    links = group.id.links
+    return tuple(
+        (name, links.get_info(name.encode()).u) for name in group.keys()
+    )
+
+
+def set_metadata_cache(h5_file, initial_size=2**27):
+    """
+    Raise the initial size of the HDF5 metadata cache of an open file.
+
+    The HDF5 default is 2 MB, which is small for files that hold many
+    small groups and attributes, like a filter tree with hundreds of
+    filters.  A larger initial size avoids resizing the cache as it fills.
+    The maximum size is raised to match if needed.  Nothing is changed if
+    the cache is already at least `initial_size`, so it is safe to call
+    more than once on the same file.
+
+    The raw data chunk cache can only be set when the file is opened, pass
+    `rdcc_nbytes`, `rdcc_nslots` and `rdcc_w0` to `h5py.File` for that.
+
+    :param h5_file: open HDF5 file
+    :type h5_file: :class:`h5py.File`
+    :param initial_size: initial size of the metadata cache in bytes,
+     defaults to 2**27 (128 MB)
+    :type initial_size: int, optional
+    :return: True if the cache configuration was changed
+    :rtype: bool
+
+    """
+    config = h5_file.id.get_mdc_config()
+    if config.initial_size >= initial_size:
+        return False
+    config.set_initial_size = True
+    config.initial_size = initial_size
+    config.max_size = max(config.max_size, initial_size)
+    h5_file.id.set_mdc_config(config)
+    return True
+
+
 def recursive_hdf5_tree(group, lines=[]):
     if isinstance(group, (h5py._hl.group.Group, h5py._hl.files.File)):
         for key, value in group.items():
@@ -200,6 +311,27 @@ def to_numpy_type(value):
         raise TypeError("Type {0} not understood".format(type(value)))
 
 
+def write_attributes(h5_object, meta_dict):
+    """
+    Write a flat metadata dictionary to the attributes of an HDF5 group or
+    dataset.
+
+    The attribute manager is fetched once for the whole dictionary.  Values
+    are written with `attrs.create`, which is faster than `attrs.modify` or
+    item assignment and lets an attribute change type, e.g. from "none" to
+    a float.
+
+    :param h5_object: HDF5 group or dataset to write to
+    :type h5_object: :class:`h5py.Group` or :class:`h5py.Dataset`
+    :param meta_dict: metadata as {attribute name: value}
+    :type meta_dict: dict
+
+    """
+    attrs = h5_object.attrs
+    for key, value in meta_dict.items():
+        attrs.create(key, to_numpy_type(value))
+
+
 def validate_name(name):
     """
     make sure the name has no spaces or slashes
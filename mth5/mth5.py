@@ -154,6 +154,10 @@ class MTH5:
     :type data_level: integer, defaults to 1
     :param file_version: Version of the file [ '0.1.0' | '0.2.0' ], defaults to "0.2.0"
     :type file_version: string, optional
+    :param chunk_size: number of samples per chunk for channels added through
+     this object.  If None chunks hold about 1 MiB of samples, which suits
+     reading long contiguous pieces of time, defaults to None
+    :type chunk_size: int, optional
 
     :Usage:
 
@@ -262,6 +266,7 @@ class MTH5:
         fletcher32=True,
         data_level=1,
         file_version="0.2.0",
+        chunk_size=None,
     ):
         self.logger = logger
 
@@ -273,6 +278,7 @@ class MTH5:
         ) = helpers.validate_compression(compression, compression_opts)
         self.__shuffle = shuffle
         self.__fletcher32 = fletcher32
+        self.__chunk_size = chunk_size
 
         self.data_level = data_level
         self.filename = filename
@@ -306,6 +312,11 @@ class MTH5:
             "fletcher32": self.__fletcher32,
         }
 
+    @property
+    def chunk_size(self):
+        """number of samples per chunk for new channels"""
+        return self.__chunk_size
+
     @property
     def file_attributes(self):
         return {
@@ -471,6 +482,7 @@ class MTH5:
             if self.file_version in ["0.2.0"]:
                 return groups.ExperimentGroup(
                     self.__hdf5_obj[f"{self._root_path}"],
+                    chunk_size=self.__chunk_size,
                     **self.dataset_options,
                 )
             else:
@@ -488,6 +500,7 @@ class MTH5:
             if self.h5_is_read():
                 return groups.SurveyGroup(
                     self.__hdf5_obj[f"{self._root_path}"],
+                    chunk_size=self.__chunk_size,
                     **self.dataset_options,
                 )
             self.logger.info("File is closed cannot access /Survey")
@@ -508,6 +521,7 @@ class MTH5:
             if self.h5_is_read():
                 return groups.MasterSurveyGroup(
                     self.__hdf5_obj[f"{self._root_path}/Surveys"],
+                    chunk_size=self.__chunk_size,
                     **self.dataset_options,
                 )
             self.logger.info("File is closed cannot access /Surveys")
@@ -564,6 +578,7 @@ class MTH5:
                 return None
             return groups.MasterStationGroup(
                 self.__hdf5_obj[f"{self._root_path}/Stations"],
+                chunk_size=self.__chunk_size,
                 **self.dataset_options,
             )
         self.logger.info("File is closed cannot access /Stations")
@@ -583,10 +598,40 @@ class MTH5:
                 station_list += sg.stations_group.groups_list
             return station_list
 
-    def open_mth5(self, filename=None, mode="a", **kwargs):
+    def open_mth5(
+        self,
+        filename=None,
+        mode="a",
+        in_memory=False,
+        metadata_cache_size=None,
+        **kwargs,
+    ):
         """
         open an mth5 file
 
+        :param filename: file name to open, defaults to None
+        :type filename: string or :class:`pathlib.Path`, optional
+        :param mode: mode to open the file in, defaults to "a"
+        :type mode: string, optional
+        :param in_memory: keep the file in memory with the HDF5 core driver
+         and never write it to disk, useful for temporary files, defaults to
+         False
+        :type in_memory: bool, optional
+        :param metadata_cache_size: initial size in bytes of the HDF5
+         metadata cache, see :func:`mth5.helpers.set_metadata_cache`.  The
+         HDF5 default of 2 MB is small for files with many groups and
+         attributes, like thousands of filters, 2**27 (128 MB) is a good
+         value for those.  None leaves the HDF5 default, defaults to None
+        :type metadata_cache_size: int, optional
+        :param **kwargs: keyword arguments passed on to :class:`h5py.File`.
+         For example the raw data chunk cache can be tuned with
+         `rdcc_nbytes`, `rdcc_nslots` (preferably a prime number) and
+         `rdcc_w0`.  A larger cache is mostly useful when writing or reading
+         many chunks repeatedly, the h5py default is 1 MB.  `libver`
+         sets the oldest HDF5 version that can read the file.  h5py uses
+         "earliest" by default, "latest" writes smaller object headers and
+         is faster when making many groups, but the file needs
+         HDF5 >= 1.10 to read.
         :return: Survey Group
         :type: groups.SurveyGroup
 
@@ -604,6 +649,8 @@ class MTH5:
 
 
         """
+        if in_memory:
+            kwargs.update({"driver": "core", "backing_store": False})
         if filename is not None:
             self.__filename = filename
         if not isinstance(self.__filename, Path):
@@ -614,7 +661,7 @@ class MTH5:
                     f"{self.__filename.name} will be overwritten in 'w' mode"
                 )
                 try:
-                    self._initialize_file(mode)
+                    self._initialize_file(mode, **kwargs)
                 except OSError as error:
                     msg = (
                         f"{error}. Need to close any references to {self.__filename} first. "
@@ -650,6 +697,8 @@ class MTH5:
         # TODO need to add a validation step to check for version and legit file
         if not "channel_summary" in self.__hdf5_obj[self._root_path].keys():
             self._initialize_summary()
+        if metadata_cache_size is not None:
+            helpers.set_metadata_cache(self.__hdf5_obj, metadata_cache_size)
         return self
 
     def _initialize_file(self, mode="w", **kwargs):
@@ -813,16 +862,34 @@ class MTH5:
     def has_group(self, group_name):
         """
         Check to see if the group name exists
+
+        The path is looked up directly, which only resolves the links along
+        the path instead of walking the whole file.
+
+        :param group_name: path relative to the root, e.g.
+         "Experiment/Surveys"
+        :type group_name: string
+        :return: True if the group or dataset exists
+        :rtype: bool
+
         """
         if self.h5_is_read():
+            return group_name in self.__hdf5_obj
 
-            def has_name(name):
-                if group_name == name:
-                    return True
+    def group_set(self):
+        """
+        Get the names of all groups and datasets in the file from a single
+        walk of the file.  Use this when checking for many groups at once
+        instead of calling `has_group` for each one.
 
-            if self.__hdf5_obj.visit(has_name):
-                return True
-            return False
+        :return: names relative to the root, e.g. "Experiment/Surveys"
+        :rtype: set
+
+        """
+        names = set()
+        if self.h5_is_read():
+            self.__hdf5_obj.visit(names.add)
+        return names
 
     def _make_h5_path(
         self, survey=None, station=None, run=None, channel=None, tf_id=None
@@ -952,17 +1019,16 @@ class MTH5:
                         mt_run.update_metadata()
                     mt_station.update_metadata()
                 sg.update_metadata()
-                for k, v in experiment.surveys[0].filters.items():
-                    self.filters_group.add_filter(v)
+                self.filters_group.add_filters(
+                    experiment.surveys[0].filters.values()
+                )
             elif self.file_version in ["0.2.0"]:
                 for survey in experiment.surveys:
                     sg = self.add_survey(survey.id, survey_metadata=survey)
 
                     for station in survey.stations:
-                        mt_station = self.add_station(
-                            station.id,
-                            station_metadata=station,
-                            survey=sg.metadata.id,
+                        mt_station = sg.stations_group.add_station(
+                            station.id, station_metadata=station
                         )
                         if update:
                             mt_station.metadata.update(station)
@@ -987,8 +1053,7 @@ class MTH5:
                             mt_run.update_metadata()
                         mt_station.update_metadata()
                     sg.update_metadata()
-                    for k, v in survey.filters.items():
-                        sg.filters_group.add_filter(v)
+                    sg.filters_group.add_filters(survey.filters.values())
 
     @property
     def channel_summary(self):
@@ -1074,6 +1139,7 @@ class MTH5:
         try:
             group = groups.SurveyGroup(
                 self.__hdf5_obj[survey_path],
+                chunk_size=self.__chunk_size,
                 **self.dataset_options,
             )
             group.read_metadata()
@@ -1196,7 +1262,9 @@ class MTH5:
         station_path = self._make_h5_path(survey=survey, station=station_name)
         try:
             group = groups.StationGroup(
-                self.__hdf5_obj[station_path], **self.dataset_options
+                self.__hdf5_obj[station_path],
+                chunk_size=self.__chunk_size,
+                **self.dataset_options,
             )
             group.read_metadata()
             return group
@@ -1292,7 +1360,9 @@ class MTH5:
         )
         try:
             group = groups.RunGroup(
-                self.__hdf5_obj[run_path], **self.dataset_options
+                self.__hdf5_obj[run_path],
+                chunk_size=self.__chunk_size,
+                **self.dataset_options,
             )
             group.read_metadata()
             return group
@@ -1436,7 +1506,11 @@ class MTH5:
         run_path = self._make_h5_path(
             survey=survey, station=station_name, run=run_name
         )
-        rg = groups.RunGroup(self.__hdf5_obj[run_path], **self.dataset_options)
+        rg = groups.RunGroup(
+            self.__hdf5_obj[run_path],
+            chunk_size=self.__chunk_size,
+            **self.dataset_options,
+        )
         rg.read_metadata()
         try:
             return rg.get_channel(helpers.validate_name(channel_name))
@@ -43,6 +43,14 @@ from scipy import signal
 # =============================================================================
 meta_classes = dict(inspect.getmembers(metadata, inspect.isclass))
 
+# first letter of a component for each channel type and whether the component
+# must (True) or must not (False) start with one of those letters.
+_COMPONENT_PREFIXES = {
+    "electric": (frozenset("e"), True),
+    "magnetic": (frozenset("hb"), True),
+    "auxiliary": (frozenset("ehb"), False),
+}
+
 
 # ==============================================================================
 # Channel Time Series Object
@@ -100,6 +108,9 @@ class ChannelTS:
 
     """
 
+    # shared by all instances instead of being set on each one
+    logger = logger
+
     def __init__(
         self,
         channel_type="auxiliary",
@@ -110,13 +121,13 @@ class ChannelTS:
         survey_metadata=None,
         **kwargs,
     ):
-
-        self.logger = logger
-
         self._channel_type = self._validate_channel_type(channel_type)
         self._survey_metadata = self._initialize_metadata()
 
-        self.data_array = xr.DataArray([1], coords=[("time", [1])], name="ts")
+        # the data array is only made once data or metadata is set
+        self._time_xindex = None
+        self._time_index = None
+        self._data_array = None
         self._channel_response = ChannelResponse()
 
         self.survey_metadata = survey_metadata
@@ -130,6 +141,9 @@ class ChannelTS:
         if data is not None:
             self.ts = data
         else:
+            self.data_array = xr.DataArray(
+                [1], coords=[("time", [1])], name="ts"
+            )
             self._update_xarray_metadata()
 
         for key in list(kwargs.keys()):
@@ -468,6 +482,35 @@ class ChannelTS:
             )
 
     ### Properties ------------------------------------------------------------
+    @property
+    def data_array(self):
+        """xarray.DataArray holding the time series"""
+        return self._data_array
+
+    @data_array.setter
+    def data_array(self, value):
+        """set the data array"""
+        self._data_array = value
+
+    def _get_time_index(self):
+        """
+        Get the time index of the data array as a :class:`pandas.DatetimeIndex`.
+
+        xarray builds the index through pandas, which is slow to do on every
+        property call, so it is cached.  Any change to the time coordinate,
+        including in place edits of `data_array.coords`, makes a new xarray
+        index object, which resets the cache.
+
+        :return: time index
+        :rtype: :class:`pandas.Index`
+
+        """
+        xindex = self._data_array.xindexes["time"]
+        if self._time_xindex is not xindex:
+            self._time_xindex = xindex
+            self._time_index = xindex.to_pandas_index()
+        return self._time_index
+
     @property
     def survey_metadata(self):
         """
@@ -630,9 +673,11 @@ class ChannelTS:
             self.logger.error(msg)
             raise ValueError(msg)
 
-        if isinstance(type(ts_arr.data.dtype), type(np.object_)):
+        # only object columns need converting, numeric data keeps its dtype
+        # so float32 data is not copied up to float64.
+        if ts_arr["data"].dtype == np.object_:
             try:
-                ts_arr["data"] = ts_arr.data.astype(float)
+                ts_arr = ts_arr.assign(data=ts_arr["data"].astype(float))
             except ValueError:
                 raise ValueError(
                     "DataFrame dtype is 'object' and cannot convert "
@@ -646,7 +691,7 @@ class ChannelTS:
         Validate pd.DataFrame and pd.Seried objects
         """
 
-        if isinstance(type(ts_arr.dtype), type(np.object_)):
+        if ts_arr.dtype == np.object_:
             try:
                 ts_arr = ts_arr.astype(float)
             except ValueError:
@@ -676,10 +721,9 @@ class ChannelTS:
         """
 
         if isinstance(ts_arr, (np.ndarray, list, tuple)):
-            if not isinstance(ts_arr, np.ndarray):
-                ts_arr = np.array(ts_arr)
+            ts_arr = np.asarray(ts_arr)
             # Validate an input array to make sure its 1D
-            if len(ts_arr.shape) == 2:
+            if ts_arr.ndim == 2:
                 if 1 in ts_arr.shape:
                     ts_arr = ts_arr.reshape(ts_arr.size)
                 else:
@@ -692,9 +736,13 @@ class ChannelTS:
             )
             self._update_xarray_metadata()
         elif isinstance(ts_arr, pd.core.frame.DataFrame):
+            # slower path, the data column is pulled out as a contiguous
+            # numpy array in its own dtype.
             ts_arr, dt = self._validate_dataframe_input(ts_arr)
             self.data_array = xr.DataArray(
-                ts_arr["data"], coords=[("time", dt)], name=self.component
+                np.ascontiguousarray(ts_arr["data"].to_numpy()),
+                coords=[("time", dt)],
+                name=self.component,
             )
             self._update_xarray_metadata()
 
@@ -707,20 +755,22 @@ class ChannelTS:
         elif isinstance(ts_arr, xr.DataArray):
             # TODO: need to validate the input xarray
             self.data_array = ts_arr
-            # need to pull out the metadata as a separate dictionary
-            meta_dict = dict([(k, v) for k, v in ts_arr.attrs.items()])
-
-            # need to get station and run metadata out
+            # need to pull out the channel, survey, station and run metadata
+            # as separate dictionaries, do it in one pass over the attrs.
+            meta_dict = {}
             survey_dict = {}
             station_dict = {}
             run_dict = {}
 
-            for key in [k for k in meta_dict.keys() if "survey." in k]:
-                survey_dict[key.split("station.")[-1]] = meta_dict.pop(key)
-            for key in [k for k in meta_dict.keys() if "station." in k]:
-                station_dict[key.split("station.")[-1]] = meta_dict.pop(key)
-            for key in [k for k in meta_dict.keys() if "run." in k]:
-                run_dict[key.split("run.")[-1]] = meta_dict.pop(key)
+            for key, value in ts_arr.attrs.items():
+                if "survey." in key:
+                    survey_dict[key.split("survey.")[-1]] = value
+                elif "station." in key:
+                    station_dict[key.split("station.")[-1]] = value
+                elif "run." in key:
+                    run_dict[key.split("run.")[-1]] = value
+                else:
+                    meta_dict[key] = value
             self.channel_type = meta_dict["type"]
             ch_metadata = meta_classes[self.channel_type]()
             ch_metadata.from_dict({self.channel_type: meta_dict})
@@ -797,20 +847,24 @@ class ChannelTS:
         metadata.
 
         """
+        if self._data_array is None:
+            return
         self.logger.debug("Updating xarray attributes")
 
-        self.channel_metadata.time_period.start = self.start.iso_no_tz
-        self.channel_metadata.time_period.end = self.end.iso_no_tz
-        self.channel_metadata.sample_rate = self.sample_rate
+        # get the channel metadata once, the property checks for data and
+        # resets the sample rate on every access.
+        ch_metadata = self.channel_metadata
+        ch_metadata.time_period.start = self.start.iso_no_tz
+        ch_metadata.time_period.end = self.end.iso_no_tz
+        ch_metadata.sample_rate = self.sample_rate
 
-        self.data_array.attrs.update(
-            self.channel_metadata.to_dict()[self.channel_metadata._class_name]
-        )
+        attrs = ch_metadata.to_dict()[ch_metadata._class_name]
         # add station and run id's here, for now this is all we need but may need
         # more metadata down the road.
-        self.data_array.attrs["station.id"] = self.station_metadata.id
-        self.data_array.attrs["run.id"] = self.run_metadata.id
-        self.data_array.name = self.component
+        attrs["station.id"] = self.station_metadata.id
+        attrs["run.id"] = self.run_metadata.id
+        self.data_array.attrs.update(attrs)
+        self.data_array.name = ch_metadata.component
 
     @property
     def component(self):
@@ -820,26 +874,21 @@ class ChannelTS:
     @component.setter
     def component(self, comp):
         """set component in metadata and carry through"""
-        if self.channel_metadata.type == "electric":
-            if comp[0].lower() != "e":
-                msg = (
-                    "The current timeseries is an electric channel. "
-                    "Cannot change channel type, create a new ChannelTS object."
-                )
-                self.logger.error(msg)
-                raise ValueError(msg)
-        elif self.channel_metadata.type == "magnetic":
-            if comp[0].lower() not in ["h", "b"]:
-                msg = (
-                    "The current timeseries is a magnetic channel. "
-                    "Cannot change channel type, create a new ChannelTS object."
-                )
-                self.logger.error(msg)
-                raise ValueError(msg)
-        if self.channel_metadata.type == "auxiliary":
-            if comp[0].lower() in ["e", "h", "b"]:
+        # nothing to carry through if the component is already set in the
+        # metadata, the run channel keys and the xarray attributes.
+        if (
+            comp == self.channel_metadata.component
+            and self.run_metadata.channels.keys()[0] == comp
+            and self.data_array.attrs.get("component") == comp
+        ):
+            return
+        ch_type = self.channel_metadata.type
+        if ch_type in _COMPONENT_PREFIXES:
+            prefixes, must_match = _COMPONENT_PREFIXES[ch_type]
+            if (comp[0].lower() in prefixes) is not must_match:
+                article = "a" if ch_type == "magnetic" else "an"
                 msg = (
-                    "The current timeseries is an auxiliary channel. "
+                    f"The current timeseries is {article} {ch_type} channel. "
                     "Cannot change channel type, create a new ChannelTS object."
                 )
                 self.logger.error(msg)
@@ -873,9 +922,11 @@ class ChannelTS:
         """
         check to see if there is an index in the time series
         """
-        if self.data_array.data.size > 1:
+        if self._data_array is None:
+            return False
+        if self._data_array.data.size > 1:
             if isinstance(
-                self.data_array.indexes["time"][0],
+                self._get_time_index()[0],
                 pd._libs.tslibs.timestamps.Timestamp,
             ):
                 return True
@@ -889,8 +940,8 @@ class ChannelTS:
         can be parameterized in future
         """
         if (
-            self.data_array.coords.indexes["time"][1]
-            - self.data_array.coords.indexes["time"][0]
+            self._get_time_index()[1]
+            - self._get_time_index()[0]
         ).total_seconds() < threshold_dt:
             return True
         else:
@@ -907,7 +958,7 @@ class ChannelTS:
 
         """
         if self.is_high_frequency():
-            dt_array = np.diff(self.data_array.coords.indexes["time"])
+            dt_array = np.diff(self._get_time_index())
             best_dt, counts = scipy.stats.mode(dt_array)
 
             # Calculate total seconds of the best dt and calculate sample rate
@@ -915,8 +966,8 @@ class ChannelTS:
             sr = 1 / best_dt_seconds
         else:
             t_diff = (
-                self.data_array.coords.indexes["time"][-1]
-                - self.data_array.coords.indexes["time"][0]
+                self._get_time_index()[-1]
+                - self._get_time_index()[0]
             )
             sr = self.data_array.size / t_diff.total_seconds()
         return np.round(sr, 0)
@@ -992,7 +1043,7 @@ class ChannelTS:
     def start(self):
         """MTime object"""
         if self.has_data():
-            return MTime(self.data_array.coords.indexes["time"][0].isoformat())
+            return MTime(self._get_time_index()[0])
         else:
             self.logger.debug(
                 "Data not set yet, pulling start time from "
@@ -1020,9 +1071,11 @@ class ChannelTS:
             start_time = MTime(start_time)
         self.channel_metadata.time_period.start = start_time.iso_str
         if self.has_data():
-            if start_time == MTime(
-                self.data_array.coords.indexes["time"][0].isoformat()
-            ):
+            # compare integer nanoseconds, no need to build an MTime
+            new_start_ns = np.datetime64(start_time.iso_no_tz, "ns").astype(
+                np.int64
+            )
+            if new_start_ns == self._get_time_index().asi8[0]:
                 return
             else:
                 new_dt = make_dt_coordinates(
@@ -1042,7 +1095,7 @@ class ChannelTS:
     def end(self):
         """MTime object"""
         if self.has_data():
-            return MTime(self.data_array.coords.indexes["time"][-1].isoformat())
+            return MTime(self._get_time_index()[-1])
         else:
             self.logger.debug(
                 "Data not set yet, pulling end time from metadata.time_period.end"
@@ -1279,7 +1332,7 @@ class ChannelTS:
 
         Looks for >= start & <= end
 
-        Uses loc to be exact with milliseconds
+        Uses a binary search on the time index to find the start and end
 
         :param start: start time of the slice
         :type start: string, MTime
@@ -1308,11 +1361,13 @@ class ChannelTS:
         if end is not None:
             if not isinstance(end, MTime):
                 end = MTime(end)
-        chunk = self.data_array.indexes["time"].slice_indexer(
-            start=np.datetime64(start.iso_no_tz),
-            end=np.datetime64(end.iso_no_tz),
+        # the time index is monotonic so a binary search gives the positions
+        time_index = self._get_time_index()
+        i_start = time_index.searchsorted(
+            np.datetime64(start.iso_no_tz), side="left"
         )
-        new_ts = self.data_array.isel(indexers={"time": chunk})
+        i_end = time_index.searchsorted(np.datetime64(end.iso_no_tz), side="right")
+        new_ts = self.data_array.isel(indexers={"time": slice(i_start, i_end)})
 
         new_ch_ts = ChannelTS(
             channel_type=self.channel_type,
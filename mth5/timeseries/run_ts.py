@@ -60,6 +60,9 @@ class RunTS:
 
     """
 
+    # shared by all instances instead of being set on each one
+    logger = logger
+
     def __init__(
         self,
         array_list=None,
@@ -67,7 +70,6 @@ class RunTS:
         station_metadata=None,
         survey_metadata=None,
     ):
-        self.logger = logger
         self._survey_metadata = self._initialize_metadata()
         self._dataset = xr.Dataset()
         self._filters = {}
@@ -284,11 +286,9 @@ class RunTS:
         channels = ListDict()
 
         for index, item in enumerate(array_list):
-            if not isinstance(item, (ChannelTS, xr.DataArray)):
-                msg = f"array entry {index} must be ChannelTS object not {type(item)}"
-                self.logger.error(msg)
-                raise TypeError(msg)
-            if isinstance(item, ChannelTS):
+            # lists are nearly always all ChannelTS, so check the exact class
+            # first and only fall back on isinstance for subclasses.
+            if item.__class__ is ChannelTS or isinstance(item, ChannelTS):
                 valid_list.append(item.to_xarray())
 
                 # if a channelTS is input then it comes with run and station metadata
@@ -312,8 +312,12 @@ class RunTS:
                 if item.channel_response.filters_list != []:
                     for ff in item.channel_response.filters_list:
                         self._filters[ff.name] = ff
-            else:
+            elif isinstance(item, xr.DataArray):
                 valid_list.append(item)
+            else:
+                msg = f"array entry {index} must be ChannelTS object not {type(item)}"
+                self.logger.error(msg)
+                raise TypeError(msg)
         # need to make sure that the station metadata was actually updated,
         # should have an ID.
         run_metadata.channels = channels
@@ -349,6 +353,9 @@ class RunTS:
 
         """
 
+        if len(valid_list) < 2:
+            return valid_list
+
         earliest_start = self._get_earliest_start(valid_list)
         latest_end = self._get_latest_end(valid_list)
         reindex = False
@@ -466,7 +473,7 @@ class RunTS:
         """
 
         filter_list = []
-        if ch_name in self.dataset.keys():
+        if ch_name in self._dataset.data_vars:
             for filter_name in self.dataset[ch_name].attrs["filter.name"]:
                 try:
                     filter_list.append(self.filters[filter_name])
@@ -477,25 +484,29 @@ class RunTS:
         return ChannelResponse(filters_list=filter_list)
 
     def __getattr__(self, name):
+        # private attributes are never channels, check first so a missing
+        # _dataset does not recurse back into __getattr__
+        if name[0] == "_":
+            return None
         # change to look for keys directly and use type to set channel type
-        if name in self.dataset.keys():
+        data_vars = self._dataset.data_vars
+        if name in data_vars:
             ch_response_filter = self._get_channel_response(name)
             # if cannot get filters, but the filters name indicates that
             # filters should be there don't input the channel response filter
             # cause then an empty filters_list will set filter.name to []
             if ch_response_filter.filters_list == []:
                 ch_response_filter = None
+            ch = data_vars[name]
             return ChannelTS(
-                self.dataset[name].attrs["type"],
-                self.dataset[name],
+                ch.attrs["type"],
+                ch,
                 run_metadata=self.run_metadata.copy(),
                 station_metadata=self.station_metadata.copy(),
                 channel_response=ch_response_filter,
             )
         else:
             # this is a hack for now until figure out who is calling shape, size
-            if name[0] == "_":
-                return None
             if name not in ["shape", "size"]:
                 try:
                     return super().__getattribute__(name)
@@ -715,10 +726,20 @@ class RunTS:
         """
         if isinstance(array_list, (list, tuple)):
             x_array_list = self._validate_array_list(array_list)
+            if len(x_array_list) > 1:
+                # channels from the same run usually share the same time
+                # index already, only align if they do not.
+                time_index = x_array_list[0].indexes["time"]
+                if not all(
+                    x.indexes["time"].equals(time_index)
+                    for x in x_array_list[1:]
+                ):
+                    x_array_list = xr.align(*x_array_list, join=align_type)
 
             # input as a dictionary
-            xdict = dict([(x.component.lower(), x) for x in x_array_list])
-            self._dataset = xr.Dataset(xdict)
+            self._dataset = xr.Dataset(
+                {x.attrs["component"].lower(): x for x in x_array_list}
+            )
         elif isinstance(array_list, xr.Dataset):
             self._dataset = array_list
         self.validate_metadata()
@@ -789,14 +810,14 @@ class RunTS:
     def start(self):
         """Start time UTC"""
         if self.has_data():
-            return MTime(self.dataset.coords["time"].to_index()[0].isoformat())
+            return MTime(self.dataset.indexes["time"][0])
         return self.run_metadata.time_period.start
 
     @property
     def end(self):
         """End time UTC"""
         if self.has_data():
-            return MTime(self.dataset.coords["time"].to_index()[-1].isoformat())
+            return MTime(self.dataset.indexes["time"][-1])
         return self.run_metadata.time_period.end
 
     def _compute_sample_rate(self):
@@ -849,7 +870,7 @@ class RunTS:
     @property
     def channels(self):
         """List of channel names in dataset"""
-        return [cc for cc in list(self.dataset.data_vars)]
+        return list(self._dataset.data_vars)
 
     @property
     def filters(self):
@@ -986,9 +1007,9 @@ class RunTS:
         Get just a chunk of data from the run, this will attempt to find the
         closest points to the given parameters.
 
-        .. note:: We use pandas `slice_indexer` because xarray slice does not
-        seem to work as well, even though they should be based on the same
-        code.
+        .. note:: We use pandas `searchsorted` on the time index because xarray
+        slice does not seem to work as well, even though they should be based
+        on the same code.
 
         :param start: start time of the slice
         :type start: string or :class:`mt_metadata.utils.mttime.MTime`
@@ -1011,9 +1032,11 @@ class RunTS:
                 end = MTime(end)
         else:
             raise ValueError("Must input n_samples or end")
-        chunk = self.dataset.indexes["time"].slice_indexer(
-            start=np.datetime64(start.iso_no_tz),
-            end=np.datetime64(end.iso_no_tz),
+        # the time index is monotonic so a binary search gives the positions
+        time_index = self.dataset.indexes["time"]
+        chunk = slice(
+            time_index.searchsorted(np.datetime64(start.iso_no_tz), side="left"),
+            time_index.searchsorted(np.datetime64(end.iso_no_tz), side="right"),
         )
 
         new_runts = RunTS()
@@ -1042,6 +1065,33 @@ class RunTS:
             new_run.add_channel(calibrated_ch_ts)
         return new_run
 
+    def _has_integer_decimation(self, new_sample_rate, max_decimation=8):
+        """
+        Check that every stage :meth:`RunTS.decimate` would use to get to
+        `new_sample_rate` is an exact integer factor.  Intermediate sample
+        rates are rounded, so large factors are not always exact.
+
+        :param new_sample_rate: new sample rate
+        :type new_sample_rate: float
+        :param max_decimation: largest factor of a single stage, defaults
+         to 8
+        :type max_decimation: int, optional
+        :return: True if decimating gives exactly `new_sample_rate`
+        :rtype: bool
+
+        """
+        if self.sample_rate <= new_sample_rate:
+            return False
+        step_sr = self.sample_rate
+        for next_sr in get_decimation_sample_rates(
+            self.sample_rate, new_sample_rate, max_decimation
+        ):
+            factor = step_sr / next_sr
+            if not np.isclose(factor, np.round(factor)):
+                return False
+            step_sr = next_sr
+        return True
+
     def decimate(self, new_sample_rate, inplace=False, max_decimation=8):
         """
         decimate data to new sample rate.
@@ -1114,6 +1164,13 @@ class RunTS:
     def resample(self, new_sample_rate, inplace=False):
         """
         Resample data to new sample rate.
+
+        If the new sample rate can be reached from the current sample rate
+        by decimating with integer factors at every stage and the data have
+        no gaps (NaN), the data are decimated with :meth:`RunTS.decimate`,
+        which applies an anti-alias filter.  Otherwise the nearest sample is
+        used, which keeps gaps as NaN instead of filling them with zeros.
+
         :param new_sample_rate: DESCRIPTION
         :type new_sample_rate: TYPE
         :param inplace: DESCRIPTION, defaults to False
@@ -1122,6 +1179,12 @@ class RunTS:
         :rtype: TYPE
         """
 
+        # decimate fills NaN with 0, so only use it for data without gaps
+        if self._has_integer_decimation(new_sample_rate) and not bool(
+            self.dataset.to_array().isnull().any()
+        ):
+            return self.decimate(new_sample_rate, inplace=inplace)
+
         new_dt_freq = "{0:.0f}N".format(1e9 / (new_sample_rate))
 
         new_ds = self.dataset.resample(time=new_dt_freq).nearest(
@@ -1257,33 +1320,40 @@ class RunTS:
 
         plot the time series probably slow for large data sets
 
+        :param color_map: colors of channels
+        :type color_map: dictionary, optional
+        :param channel_order: order to plot the channels in, defaults to None
+         which plots in the order of the dataset
+        :type channel_order: list, optional
+        :return: figure object
+        :rtype: matplotlib.figure
+
         """
 
         if channel_order is not None:
-            ch_list = channel_order()
+            ch_list = list(channel_order)
         else:
             ch_list = self.channels
-        n_channels = len(self.channels)
-
-        fig = plt.figure()
-        fig.subplots_adjust(hspace=0)
-        ax_list = []
-        for ii, comp in enumerate(ch_list, 1):
-            try:
-                color = color_map[comp]
-            except KeyError:
-                color = (0, 0.4, 0.8)
-            if ii == 1:
-                ax = plt.subplot(n_channels, 1, ii)
-            else:
-                ax = plt.subplot(n_channels, 1, ii, sharex=ax_list[0])
-            self.dataset[comp].plot.line(ax=ax, color=color)
+        n_channels = len(ch_list)
+
+        # make all the axes at once so they share one x-axis and the time
+        # index is only pulled out of the dataset once.
+        fig, axes = plt.subplots(
+            n_channels,
+            1,
+            sharex=True,
+            squeeze=False,
+            gridspec_kw={"hspace": 0},
+        )
+        time_index = self.dataset.indexes["time"]
+        for ax, comp in zip(axes[:, 0], ch_list):
+            color = color_map.get(comp, (0, 0.4, 0.8))
+            ax.plot(time_index, self.dataset[comp].data, color=color)
+            ax.set_ylabel(comp)
             ax.grid(which="major", color=(0.65, 0.65, 0.65), ls="--", lw=0.75)
             ax.grid(which="minor", color=(0.85, 0.85, 0.85), ls="--", lw=0.5)
             ax.set_axisbelow(True)
-            if ii != len(ch_list):
-                plt.setp(ax.get_xticklabels(), visible=False)
-            ax_list.append(ax)
+        axes[-1, 0].set_xlabel("time")
         return fig
 
     def plot_spectra(
@@ -7,6 +7,8 @@ Created on Wed Mar 29 14:27:22 2023
 # =============================================================================
 # Imports
 # =============================================================================
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from loguru import logger
@@ -57,6 +59,18 @@ def _count_decimal_sig_figs(digits):
     return len(fractional.rstrip("0"))
 
 
+@lru_cache(maxsize=32)
+def _sample_interval_sig_figs(sample_rate):
+    """
+    Return the number of significant figures of the sample interval.
+
+    Segmented readers make many time indexes at the same few sample rates,
+    so this is cached per sample rate.
+    """
+
+    return _count_decimal_sig_figs(1 / sample_rate)
+
+
 def make_dt_coordinates(start_time, sample_rate, n_samples, end_time=None):
     """
     get the date time index from the data
@@ -102,18 +116,23 @@ def make_dt_coordinates(start_time, sample_rate, n_samples, end_time=None):
         end_time = start_time + (n_samples - 1) / sample_rate
     else:
         end_time = MTime(end_time)
-    # dt_freq = "{0:.0f}N".format(1.0e9 / (sample_rate))
 
-    dt_index = pd.date_range(
-        start=start_time.iso_no_tz,
-        end=end_time.iso_no_tz,
-        periods=n_samples,
+    # build the index directly from integer nanoseconds, this is the same
+    # evenly spaced index pd.date_range(start, end, periods) makes but
+    # without the overhead of parsing and generating the range in pandas.
+    start_ns = np.datetime64(start_time.iso_no_tz, "ns").astype(np.int64)
+    end_ns = np.datetime64(end_time.iso_no_tz, "ns").astype(np.int64)
+    dt_index = pd.DatetimeIndex(
+        (
+            np.linspace(0, end_ns - start_ns, int(n_samples), dtype=np.int64)
+            + start_ns
+        ).view("datetime64[ns]")
     )
 
     ## need to enforce some rounding errors otherwise an expected time step
     ## will have a rounding error, messes things up when reindexing.
     start_sig_figs = _count_decimal_sig_figs(start_time)
-    sr_sig_figs = _count_decimal_sig_figs(1 / sample_rate)
+    sr_sig_figs = _sample_interval_sig_figs(sample_rate)
     if start_sig_figs > sr_sig_figs:
         test_sf = start_sig_figs
     else:
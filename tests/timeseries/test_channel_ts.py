@@ -343,6 +343,26 @@ class TestChannelTS(unittest.TestCase):
         with self.subTest(name="has n samples"):
             self.assertEqual(self.ts.n_samples, n_samples)
 
+    def test_df_float32_input(self):
+        df = pd.DataFrame({"data": np.arange(4096, dtype=np.float32)})
+        self.ts.ts = df
+
+        with self.subTest(name="dtype"):
+            self.assertEqual(self.ts.ts.dtype, np.float32)
+        with self.subTest(name="contiguous"):
+            self.assertTrue(self.ts.ts.flags["C_CONTIGUOUS"])
+        with self.subTest(name="input unchanged"):
+            self.assertEqual(df["data"].dtype, np.float32)
+
+    def test_df_object_input(self):
+        df = pd.DataFrame({"data": np.arange(16).astype(str).astype(object)})
+        self.ts.ts = df
+
+        with self.subTest(name="dtype"):
+            self.assertEqual(self.ts.ts.dtype, np.float64)
+        with self.subTest(name="input unchanged"):
+            self.assertEqual(df["data"].dtype, np.object_)
+
     def test_set_component(self):
         self.ts = timeseries.ChannelTS(
             "electric", channel_metadata={"electric": {"component": "ex"}}
@@ -355,6 +375,54 @@ class TestChannelTS(unittest.TestCase):
             with self.subTest(name=f"fail {ch}"):
                 self.assertRaises(ValueError, set_comp, ch)
 
+    def test_set_same_component(self):
+        self.ts.component = "temperature"
+        self.ts.component = "temperature"
+
+        with self.subTest(name="metadata"):
+            self.assertEqual(self.ts.channel_metadata.component, "temperature")
+        with self.subTest(name="attrs"):
+            self.assertEqual(
+                self.ts.data_array.attrs["component"], "temperature"
+            )
+        with self.subTest(name="run channels"):
+            self.assertListEqual(
+                ["temperature"], self.ts.run_metadata.channels.keys()
+            )
+
+    def test_set_component_after_metadata_change(self):
+        self.ts.component = "temperature"
+        self.ts.channel_metadata.component = "voltage"
+        self.ts.component = "voltage"
+
+        with self.subTest(name="attrs"):
+            self.assertEqual(self.ts.data_array.attrs["component"], "voltage")
+        with self.subTest(name="run channels"):
+            self.assertListEqual(
+                ["voltage"], self.ts.run_metadata.channels.keys()
+            )
+
+    def test_set_component_magnetic_auxiliary(self):
+        hx = timeseries.ChannelTS(
+            "magnetic", channel_metadata={"magnetic": {"component": "hx"}}
+        )
+        aux = timeseries.ChannelTS("auxiliary")
+
+        for ch in ["ex", "temperature"]:
+            with self.subTest(name=f"magnetic fail {ch}"):
+                with self.assertRaises(ValueError):
+                    hx.component = ch
+        for ch in ["ex", "hx", "bx"]:
+            with self.subTest(name=f"auxiliary fail {ch}"):
+                with self.assertRaises(ValueError):
+                    aux.component = ch
+        with self.subTest(name="magnetic bx"):
+            hx.component = "bx"
+            self.assertEqual(hx.component, "bx")
+        with self.subTest(name="auxiliary temperature"):
+            aux.component = "temperature"
+            self.assertEqual(aux.component, "temperature")
+
     def test_change_sample_rate(self):
         self.ts.sample_rate = 16
         self.ts.start = "2020-01-01T12:00:00"
@@ -372,6 +440,45 @@ class TestChannelTS(unittest.TestCase):
         with self.subTest(name="sample_interval"):
             self.assertEqual(self.ts.sample_interval, 1.0 / 8.0)
 
+    def test_change_start_resets_time_index(self):
+        self.ts.sample_rate = 16
+        self.ts.start = "2020-01-01T12:00:00"
+        self.ts.ts = np.arange(4096)
+
+        with self.subTest("original start"):
+            self.assertEqual(self.ts.start, "2020-01-01T12:00:00+00:00")
+        time_index = self.ts._get_time_index()
+        self.ts.start = "2020-01-01T12:00:00+00:00"
+        with self.subTest("same start keeps index"):
+            self.assertIs(time_index, self.ts._get_time_index())
+        self.ts.start = "2020-01-01T13:00:00"
+        with self.subTest("new start"):
+            self.assertEqual(self.ts.start, "2020-01-01T13:00:00+00:00")
+        with self.subTest("new end"):
+            self.assertEqual(self.ts.end, "2020-01-01T13:04:15.937500+00:00")
+        with self.subTest("index matches coordinate"):
+            self.assertTrue(
+                self.ts._get_time_index().equals(
+                    self.ts.data_array.indexes["time"]
+                )
+            )
+
+    def test_edit_time_coordinate_in_place(self):
+        self.ts.sample_rate = 16
+        self.ts.start = "2020-01-01T12:00:00"
+        self.ts.ts = np.arange(4096)
+        self.assertEqual(self.ts.start, "2020-01-01T12:00:00+00:00")
+
+        self.ts.data_array.coords["time"] = pd.date_range(
+            "2021-01-01", periods=4096, freq="125ms"
+        )
+        with self.subTest("start"):
+            self.assertEqual(self.ts.start, "2021-01-01T00:00:00+00:00")
+        with self.subTest("end"):
+            self.assertEqual(self.ts.end, "2021-01-01T00:08:31.875000+00:00")
+        with self.subTest("sample_rate"):
+            self.assertEqual(self.ts.compute_sample_rate(), 8)
+
     def test_to_xarray(self):
         self.ts.sample_rate = 16
         self.ts.start = "2020-01-01T12:00:00"
@@ -414,7 +521,12 @@ class TestChannelTS(unittest.TestCase):
         )
         with self.subTest("station ID"):
             self.assertEqual(ch.channel_type.lower(), "auxiliary")
-        self.ts.ts = ch.to_xarray()
+        ch_xr = ch.to_xarray()
+        ch_xr.attrs["survey.id"] = "test_survey"
+        self.ts.ts = ch_xr
+
+        with self.subTest("survey ID"):
+            self.assertEqual(self.ts.survey_metadata.id, "test_survey")
 
         with self.subTest("run ID"):
             self.assertEqual(self.ts.run_metadata.id, "0001")
@@ -437,6 +549,12 @@ class TestChannelTS(unittest.TestCase):
                 "2020-01-01T12:00:00", end="2020-01-01T12:00:02.937500"
             )
             self.assertEqual(new_ts.ts.size, 48)
+        with self.subTest(name="between samples"):
+            new_ts = self.ts.get_slice(
+                "2020-01-01T12:00:00.010000", end="2020-01-01T12:00:02.950000"
+            )
+            self.assertEqual(new_ts.ts.size, 47)
+            self.assertEqual(new_ts.start, "2020-01-01T12:00:00.062500+00:00")
 
     def test_time_slice_metadata(self):
         self.ts.component = "temp"
@@ -56,6 +56,25 @@ class TestRunTSClass(unittest.TestCase):
 
         self.run_object.set_dataset([self.ex])
 
+    def test_set_dataset_align_type(self):
+        ey = ChannelTS(
+            "electric",
+            data=np.random.rand(self.npts),
+            channel_metadata={
+                "electric": {
+                    "component": "Ey",
+                    "sample_rate": self.sample_rate,
+                    "time_period.start": self.start,
+                }
+            },
+        )
+        self.run_object.set_dataset([self.ex, ey], align_type="exact")
+
+        with self.subTest("channels"):
+            self.assertListEqual(["ex", "ey"], self.run_object.channels)
+        with self.subTest("n_samples"):
+            self.assertEqual(self.npts, self.run_object.dataset.time.size)
+
     def test_copy(self):
         run_copy = self.run_object.copy()
 
@@ -506,6 +525,60 @@ class TestRunTS(unittest.TestCase):
         with self.subTest("npts"):
             self.assertEqual(r_slice.dataset.ex.data.shape[0], npts)
 
+    def test_resample_integer_factor(self):
+        run = self.run_object.copy()
+        resampled = run.resample(2)
+        decimated = self.run_object.copy().decimate(2)
+
+        with self.subTest("sample_rate"):
+            self.assertEqual(resampled.sample_rate, 2)
+        with self.subTest("npts"):
+            self.assertEqual(resampled.dataset.time.size, self.npts / 4)
+        with self.subTest("anti-alias filtered"):
+            self.assertTrue(resampled.dataset.equals(decimated.dataset))
+
+    def test_resample_integer_factor_with_gaps(self):
+        run = self.run_object.copy()
+        run.dataset["ex"][100:300] = np.nan
+        resampled = run.resample(2)
+
+        with self.subTest("sample_rate"):
+            self.assertEqual(resampled.sample_rate, 2)
+        with self.subTest("gaps kept"):
+            self.assertEqual(int(resampled.dataset.ex.isnull().sum()), 50)
+        with self.subTest("other channels"):
+            self.assertEqual(int(resampled.dataset.ey.isnull().sum()), 0)
+
+    def test_resample_multi_stage_factor(self):
+        for sample_rate, new_sample_rate in [(24000, 24), (100, 1)]:
+            n_seconds = 200
+            ex = ChannelTS(
+                "electric",
+                data=np.random.rand(sample_rate * n_seconds),
+                channel_metadata={
+                    "electric": {
+                        "component": "ex",
+                        "sample_rate": sample_rate,
+                        "time_period.start": self.start,
+                    }
+                },
+            )
+            resampled = RunTS([ex]).resample(new_sample_rate)
+            dt = np.diff(resampled.dataset.time.values[0:2])[0]
+
+            with self.subTest("sample_rate", sample_rate=sample_rate):
+                self.assertEqual(resampled.sample_rate, new_sample_rate)
+            # nearest neighbour resampling can include the closing bin
+            with self.subTest("npts", sample_rate=sample_rate):
+                self.assertLessEqual(
+                    abs(resampled.dataset.time.size - new_sample_rate * n_seconds),
+                    1,
+                )
+            with self.subTest("dt", sample_rate=sample_rate):
+                self.assertAlmostEqual(
+                    dt / np.timedelta64(1, "s"), 1.0 / new_sample_rate, 6
+                )
+
     def test_filters_dict(self):
         self.assertEqual(
             list(self.run_object.filters.keys()), ["instrument_response"]
@@ -17,6 +17,7 @@ from mth5.timeseries.ts_helpers import (
     make_dt_coordinates,
     get_decimation_sample_rates,
     _count_decimal_sig_figs,
+    _sample_interval_sig_figs,
 )
 
 # =============================================================================
@@ -147,6 +148,17 @@ class TestMakeDtCoordinates(unittest.TestCase):
             assert delta_t1[0] != delta_t2[0]
             assert (delta_t1[1:] == delta_t2[1:]).all()
 
+    def test_matches_date_range(self):
+        start = MTime("2020-01-01T00:00:00.123456")
+        for sr in [1, 24, 150, 24000]:
+            dt = make_dt_coordinates(start, sr, 4097)
+            end = start + 4096 / sr
+            expected = pd.date_range(
+                start=start.iso_no_tz, end=end.iso_no_tz, periods=4097
+            ).round(freq="ns")
+            with self.subTest(sr):
+                self.assertTrue(dt.equals(expected))
+
 
 class TestDecimalSigFigs(unittest.TestCase):
     def test_sig_figs(self):
@@ -156,6 +168,14 @@ class TestDecimalSigFigs(unittest.TestCase):
             with self.subTest(value):
                 self.assertEqual(sig_figs, ii + 1)
 
+    def test_sample_interval_sig_figs(self):
+        for sr in [1, 8, 24, 150, 4096, 24000]:
+            with self.subTest(sr):
+                self.assertEqual(
+                    _sample_interval_sig_figs(sr),
+                    _count_decimal_sig_figs(1 / sr),
+                )
+
 
 # =============================================================================
 # Run
@@ -35,55 +35,37 @@ class TestFAPMTH5(unittest.TestCase):
         )
 
         self.fn = fn_path.joinpath("from_fap_stationxml.h5")
-        # if self.fn.exists():
-        #     self.fn.unlink()
 
         self.m = MTH5(file_version="0.1.0")
-        self.m.open_mth5(self.fn, mode="a")
+        self.m.open_mth5(
+            self.fn, mode="a", in_memory=True, libver="latest"
+        )
         self.m.from_experiment(self.experiment, 0)
 
         self.initial_has_entries = self.m.channel_summary._has_entries()
+        self.hx = self.m.get_channel("FL001", "a", "hx")
 
-    def test_has_survey(self):
-        self.assertEqual(self.m.has_group("Survey"), True)
-
-    def test_has_station(self):
-        self.assertEqual(self.m.has_group("Survey/Stations"), True)
-        self.assertEqual(self.m.has_group("Survey/Stations/FL001"), True)
-
-    def test_has_run_a(self):
-        self.assertEqual(self.m.has_group("Survey/Stations/FL001/a"), True)
+    def test_groups(self):
+        group_set = self.m.group_set()
+        for name in [
+            "Survey",
+            "Survey/Stations",
+            "Survey/Stations/FL001",
+            "Survey/Stations/FL001/a",
+            "Survey/Stations/FL001/b",
+            "Survey/Stations/FL001/a/hx",
+            "Survey/Stations/FL001/b/hx",
+            "Survey/Filters/fap/frequency response table_00",
+            "Survey/Filters/coefficient/v to counts (electric)",
+        ]:
+            with self.subTest(name):
+                self.assertIn(name, group_set)
 
     def test_run_a_has_data(self):
         run_a = self.m.get_run("FL001", "a")
-        self.assertEqual(run_a.has_data(), False)
-
-    def test_has_run_b(self):
-        self.assertEqual(self.m.has_group("Survey/Stations/FL001/b"), True)
-
-    def test_has_hx_a(self):
-        self.assertEqual(self.m.has_group("Survey/Stations/FL001/a/hx"), True)
-
-    def test_has_hx_b(self):
-        self.assertEqual(self.m.has_group("Survey/Stations/FL001/b/hx"), True)
-
-    def test_has_fap_table(self):
-
-        self.assertEqual(
-            self.m.has_group("Survey/Filters/fap/frequency response table_00"),
-            True,
-        )
-
-    def test_has_coefficient_filter(self):
-        self.assertEqual(
-            self.m.has_group(
-                "Survey/Filters/coefficient/v to counts (electric)"
-            ),
-            True,
-        )
+        self.assertFalse(run_a.has_data())
 
     def test_get_channel(self):
-        self.hx = self.m.get_channel("FL001", "a", "hx")
         fnames = [f.name for f in self.hx.channel_response.filters_list]
 
         with self.subTest("fap filter name"):
@@ -91,10 +73,9 @@ class TestFAPMTH5(unittest.TestCase):
         with self.subTest("counts filter name"):
             self.assertIn("v to counts (electric)", fnames)
         with self.subTest("channel has data"):
-            self.assertEqual(self.hx.has_data(), False)
+            self.assertFalse(self.hx.has_data())
 
     def test_fap(self):
-        self.hx = self.m.get_channel("FL001", "a", "hx")
         fap = self.hx.channel_response.filters_list[0]
         fap_exp = self.experiment.surveys[0].filters[
             "frequency response table_00"
@@ -123,7 +104,6 @@ class TestFAPMTH5(unittest.TestCase):
                 self.assertEqual(getattr(fap, k), getattr(fap_exp, k))
 
     def test_coefficient(self):
-        self.hx = self.m.get_channel("FL001", "a", "hx")
         coeff = self.hx.channel_response.filters_list[1]
         coeff_exp = self.experiment.surveys[0].filters["v to counts (electric)"]
 
@@ -132,7 +112,7 @@ class TestFAPMTH5(unittest.TestCase):
         )
 
     def test_has_entries(self):
-        self.assertEqual(False, self.initial_has_entries)
+        self.assertFalse(self.initial_has_entries)
 
     def test_run_summary_has_data(self):
         run_summary = self.m.run_summary
@@ -143,7 +123,6 @@ class TestFAPMTH5(unittest.TestCase):
     @classmethod
     def tearDownClass(self):
         self.m.close_mth5()
-        self.fn.unlink()
 
 
 # =============================================================================
@@ -257,50 +257,51 @@ class TestMTH5(unittest.TestCase):
                         ch_ts.channel_metadata.get_attr_from_name(key),
                     )
 
-        def test_channels(self):
-            runs = self.experiment.surveys[0].stations[0].runs
-            for run in runs:
-                with self.subTest(name=run.id):
-                    h5_run = self.mth5_obj.get_run(
-                        self.experiment.surveys[0].stations[0].id,
-                        run.id,
-                        self.survey_name,
-                    )
-                    for channel in run.channels:
-                        h5_channel = h5_run.get_channel(channel.component)
-
-                        sd = channel.to_dict(single=True)
-                        sd.pop("hdf5_reference")
-                        sd.pop("mth5_type")
-
-                        h5_sd = h5_channel.metadata.to_dict(single=True)
-                        h5_sd.pop("hdf5_reference")
-                        h5_sd.pop("mth5_type")
-
-                        self.assertDictEqual(h5_sd, sd)
-
-        def test_filters(self):
-            exp_filters = self.experiment.surveys[0].filters
-            sg = self.mth5_obj.get_survey(self.survey_name)
-
-            for key, value in exp_filters.items():
-                with self.subTest(name=key):
-                    key = key.replace("/", " per ").lower()
-                    sd = value.to_dict(single=True, required=False)
-                    h5_sd = sg.filters_group.to_filter_object(key)
-                    h5_sd = h5_sd.to_dict(single=True, required=False)
-                    for k in sd.keys():
-                        with self.subTest(f"{key}_{k}"):
-                            v1 = sd[k]
-                            v2 = h5_sd[k]
-                            if isinstance(v1, (float, int)):
-                                self.assertAlmostEqual(v1, float(v2), 5)
-                            elif isinstance(v1, np.ndarray):
-                                self.assertEqual(v1.dtype, v2.dtype)
-                                self.assertTrue((v1 == v2).all())
-                            else:
-                                self.assertEqual(v1, v2)
-                # self.assertDictEqual(h5_sd, sd)
+    def test_channels(self):
+        runs = self.experiment.surveys[0].stations[0].runs
+        for run in runs:
+            with self.subTest(name=run.id):
+                h5_run = self.mth5_obj.get_run(
+                    self.experiment.surveys[0].stations[0].id,
+                    run.id,
+                    self.survey_name,
+                )
+                for channel in run.channels:
+                    h5_channel = h5_run.get_channel(channel.component)
+
+                    sd = channel.to_dict(single=True)
+                    sd.pop("hdf5_reference")
+                    sd.pop("mth5_type")
+
+                    h5_sd = h5_channel.metadata.to_dict(single=True)
+                    h5_sd.pop("hdf5_reference")
+                    h5_sd.pop("mth5_type")
+
+                    self.assertDictEqual(h5_sd, sd)
+
+    def test_filters(self):
+        exp_filters = self.experiment.surveys[0].filters
+        filters_group = self.mth5_obj.get_survey(
+            self.survey_name
+        ).filters_group
+
+        for key, value in exp_filters.items():
+            with self.subTest(name=key):
+                key = key.replace("/", " per ").lower()
+                sd = value.to_dict(single=True, required=False)
+                h5_sd = filters_group.to_filter_object(key)
+                h5_sd = h5_sd.to_dict(single=True, required=False)
+                for k in sd.keys():
+                    with self.subTest(f"{key}_{k}"):
+                        v1 = sd[k]
+                        v2 = h5_sd[k]
+                        if isinstance(v1, (float, int)):
+                            self.assertAlmostEqual(v1, float(v2), 5)
+                        elif isinstance(v1, np.ndarray):
+                            self.assertEqual(v1.dtype, v2.dtype)
+                            self.assertTrue((v1 == v2).all())
+                        else:
+                            self.assertEqual(v1, v2)
 
     def test_channel_summary(self):
         self.mth5_obj.channel_summary.summarize()
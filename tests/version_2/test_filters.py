@@ -17,7 +17,14 @@ import numpy as np
 
 from mth5.mth5 import MTH5
 from mth5 import helpers
-from mt_metadata.timeseries.filters import PoleZeroFilter, CoefficientFilter
+from mth5.groups import FiltersGroup
+from mth5.timeseries import ChannelTS
+from mt_metadata.timeseries.filters import (
+    PoleZeroFilter,
+    CoefficientFilter,
+    TimeDelayFilter,
+    FrequencyResponseTableFilter,
+)
 
 fn_path = Path(__file__).parent
 # =============================================================================
@@ -82,6 +89,32 @@ class TestFilters(unittest.TestCase):
 
         self.assertTrue(new_zpk == self.zpk)
 
+    def test_zpk_compound_poles(self):
+        poles = np.zeros(2, dtype=[("real", "<f8"), ("imag", "<f8")])
+        poles["real"] = [-1, -2]
+        poles["imag"] = [3, -3]
+
+        group = self.filter_group.zpk_group.hdf5_group.create_group(
+            "zpk_compound"
+        )
+        group.create_dataset("poles", data=poles)
+        group.attrs.update(
+            {
+                "name": "zpk_compound",
+                "type": "zpk",
+                "units_in": "volts",
+                "units_out": "counts",
+            }
+        )
+
+        zpk = self.filter_group.zpk_group.to_object("zpk_compound")
+        with self.subTest("poles"):
+            np.testing.assert_array_equal(
+                zpk.poles, np.array([-1 + 3j, -2 - 3j])
+            )
+        with self.subTest("zeros"):
+            self.assertEqual(len(zpk.zeros), 0)
+
     def test_coefficient_in(self):
 
         self.assertIn(
@@ -111,6 +144,284 @@ class TestFilters(unittest.TestCase):
 
         self.assertTrue(new_coefficient == self.coefficient)
 
+    def test_filter_dict_updated_on_add(self):
+        self.assertNotIn("time_delay_test", self.filter_group.filter_dict)
+
+        time_delay = TimeDelayFilter()
+        time_delay.units_in = "volts"
+        time_delay.units_out = "volts"
+        time_delay.name = "time_delay_test"
+        time_delay.delay = -0.25
+        self.filter_group.add_filter(time_delay)
+
+        self.assertIn("time_delay_test", self.filter_group.filter_dict)
+
+    def test_filter_dict_updated_on_sub_group_add(self):
+        zpk = PoleZeroFilter(units_in="counts", units_out="mv", name="pz2")
+        zpk.poles = np.array([1 + 2j, 1 - 2j])
+
+        self.filter_group.filter_dict
+        self.filter_group.zpk_group.from_object(zpk)
+        self.filter_group.zpk_group.filter_dict
+
+        with self.subTest("in filter_dict"):
+            self.assertIn("pz2", self.filter_group.filter_dict)
+        with self.subTest("to_filter_object"):
+            self.assertTrue(self.filter_group.to_filter_object("pz2") == zpk)
+
+    def test_filter_dict_updated_from_other_instance(self):
+        coefficient = CoefficientFilter(
+            units_in="volts", units_out="volts", name="other_instance"
+        )
+        self.filter_group.filter_dict
+        self.survey_group.filters_group.add_filter(coefficient)
+
+        self.assertIn("other_instance", self.filter_group.filter_dict)
+
+    def test_filter_dict_updated_on_replace(self):
+        fap = FrequencyResponseTableFilter(
+            units_in="volts", units_out="counts", name="fap_replace"
+        )
+        fap.frequencies = np.logspace(-3, 3, 10)
+        fap.amplitudes = np.linspace(1, 10, 10)
+        fap.phases = np.linspace(-np.pi, np.pi, 10)
+        self.filter_group.add_filter(fap)
+        fap_group = self.filter_group.fap_group
+        old_address = dict(helpers.get_member_addresses(fap_group.hdf5_group))
+        fap_group.filter_dict
+
+        # replace the filter through another group object, the placeholder
+        # takes the freed space so the new filter gets a new address while
+        # the number of filters stays the same.
+        other = self.survey_group.filters_group.fap_group
+        other.hdf5_group.pop("fap_replace")
+        other.hdf5_group.create_group("placeholder")
+        fap.frequencies = np.logspace(-2, 2, 20)
+        fap.amplitudes = np.linspace(1, 10, 20)
+        fap.phases = np.linspace(-np.pi, np.pi, 20)
+        other.from_object(fap)
+        del other.hdf5_group["placeholder"]
+
+        new_address = dict(helpers.get_member_addresses(other.hdf5_group))
+        self.assertNotEqual(
+            old_address["fap_replace"], new_address["fap_replace"]
+        )
+        with self.subTest("hdf5_ref"):
+            ref = fap_group.filter_dict["fap_replace"]["hdf5_ref"]
+            np.testing.assert_array_equal(
+                fap_group.hdf5_group.file[ref]["fap_table"]["frequency"],
+                fap.frequencies,
+            )
+        with self.subTest("to_filter_object"):
+            np.testing.assert_array_equal(
+                self.filter_group.to_filter_object("fap_replace").frequencies,
+                fap.frequencies,
+            )
+
+    def test_time_delay_out(self):
+        time_delay = TimeDelayFilter()
+        time_delay.units_in = "volts"
+        time_delay.units_out = "volts"
+        time_delay.name = "time_delay_round_trip"
+        time_delay.delay = 0.5
+        self.filter_group.add_filter(time_delay)
+
+        new_time_delay = self.filter_group.to_filter_object(time_delay.name)
+
+        with self.subTest("type"):
+            self.assertIsInstance(new_time_delay, TimeDelayFilter)
+        with self.subTest("equal"):
+            self.assertTrue(new_time_delay == time_delay)
+
+    def test_fap_out(self):
+        fap = FrequencyResponseTableFilter()
+        fap.units_in = "volts"
+        fap.units_out = "counts"
+        fap.name = "fap_round_trip"
+        fap.frequencies = np.logspace(-3, 3, 50)
+        fap.amplitudes = np.linspace(1, 10, 50)
+        fap.phases = np.linspace(-np.pi, np.pi, 50)
+        self.filter_group.add_filter(fap)
+
+        new_fap = self.filter_group.to_filter_object(fap.name)
+
+        for attr in ["frequencies", "amplitudes", "phases"]:
+            with self.subTest(attr):
+                np.testing.assert_array_equal(
+                    getattr(new_fap, attr), getattr(fap, attr)
+                )
+
+    def test_fap_table_layout(self):
+        fap = FrequencyResponseTableFilter()
+        fap.units_in = "volts"
+        fap.units_out = "counts"
+        fap.name = "fap_layout"
+        fap.frequencies = np.logspace(-3, 3, 10)
+        fap.amplitudes = np.linspace(1, 10, 10)
+        fap.phases = np.linspace(-np.pi, np.pi, 10)
+        group = self.filter_group.add_filter(fap)
+
+        with self.subTest("only fap_table"):
+            self.assertListEqual(list(group.keys()), ["fap_table"])
+        with self.subTest("no extra attributes"):
+            self.assertNotIn("schema_version", group.attrs)
+        for attr, key in [
+            ("frequencies", "frequency"),
+            ("amplitudes", "amplitude"),
+            ("phases", "phase"),
+        ]:
+            with self.subTest(attr):
+                np.testing.assert_array_equal(
+                    group["fap_table"][key][:], getattr(fap, attr)
+                )
+
+    def test_fap_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.filter_group.fap_group.add_filter(
+                "fap_bad_shape",
+                [1.0, 2.0, 3.0],
+                [1.0, 2.0],
+                [0.0, 0.0, 0.0],
+                {"name": "fap_bad_shape"},
+            )
+        self.assertNotIn(
+            "fap_bad_shape", self.filter_group.fap_group.groups_list
+        )
+
+    def test_fap_precision(self):
+        frequency = np.logspace(-3, 3, 10)
+        for precision in [np.float64, np.float32]:
+            name = f"fap_{np.dtype(precision).name}"
+            group = self.filter_group.fap_group.add_filter(
+                name,
+                frequency,
+                np.linspace(1, 10, 10),
+                np.linspace(-np.pi, np.pi, 10),
+                {"name": name, "type": "frequency response table"},
+                precision=precision,
+            )
+            dtype = group["fap_table"].dtype
+            with self.subTest("frequency", precision=precision):
+                self.assertEqual(dtype["frequency"], np.float64)
+            with self.subTest("amplitude", precision=precision):
+                self.assertEqual(dtype["amplitude"], precision)
+            with self.subTest("phase", precision=precision):
+                self.assertEqual(dtype["phase"], precision)
+
+    def test_fap_table_read(self):
+        fap_table = np.zeros(
+            3,
+            dtype=[
+                ("frequency", float),
+                ("amplitude", float),
+                ("phase", float),
+            ],
+        )
+        fap_table["frequency"] = [0.1, 1, 10]
+        fap_table["amplitude"] = [1, 2, 3]
+        fap_table["phase"] = [0, 0.5, 1]
+
+        group = self.filter_group.fap_group.hdf5_group.create_group(
+            "fap_table_read"
+        )
+        group.create_dataset("fap_table", data=fap_table)
+        group.attrs.update(
+            {
+                "name": "fap_table_read",
+                "type": "frequency response table",
+                "units_in": "volts",
+                "units_out": "counts",
+            }
+        )
+
+        fap = self.filter_group.fap_group.to_object("fap_table_read")
+        for attr, key in [
+            ("frequencies", "frequency"),
+            ("amplitudes", "amplitude"),
+            ("phases", "phase"),
+        ]:
+            with self.subTest(attr):
+                np.testing.assert_array_equal(
+                    getattr(fap, attr), fap_table[key]
+                )
+
+    def test_add_filters(self):
+        filter_list = []
+        for name in ["coefficient_01", "coefficient_02"]:
+            coefficient = CoefficientFilter()
+            coefficient.units_in = "volts"
+            coefficient.units_out = "counts"
+            coefficient.name = name
+            coefficient.gain = 100.0
+            filter_list.append(coefficient)
+
+        groups = self.filter_group.add_filters(filter_list)
+
+        with self.subTest("number of groups"):
+            self.assertEqual(len(groups), 2)
+        for name in ["coefficient_01", "coefficient_02"]:
+            with self.subTest(name):
+                self.assertIn(name, self.filter_group.filter_dict)
+
+    def test_explicit_chunks(self):
+        zpk = PoleZeroFilter(
+            units_in="counts", units_out="mv", name="pz_chunks"
+        )
+        zpk.poles = np.array([1 + 2j, 0, 1 - 2j])
+        zpk.zeros = np.array([10 - 1j])
+
+        fg = FiltersGroup(
+            self.filter_group.hdf5_group,
+            chunks=(2,),
+            **self.filter_group.dataset_options,
+        )
+        group = fg.add_filter(zpk)
+
+        with self.subTest("poles"):
+            self.assertEqual(group["poles"].chunks, (2,))
+        with self.subTest("zeros"):
+            self.assertEqual(group["zeros"].chunks, (1,))
+        with self.subTest("compression"):
+            self.assertEqual(
+                group["poles"].compression,
+                self.filter_group.dataset_options["compression"],
+            )
+
+    def test_filters_from_channel_ts(self):
+        zpk = PoleZeroFilter(units_in="counts", units_out="mv", name="pz_run")
+        zpk.poles = np.array([1 + 2j, 1 - 2j])
+        channel_ts = ChannelTS(
+            channel_type="electric",
+            data=np.random.rand(64),
+            channel_metadata={
+                "electric": {
+                    "component": "ex",
+                    "sample_rate": 1,
+                    "filter.name": ["pz_run"],
+                    "filter.applied": [False],
+                }
+            },
+        )
+        channel_ts.channel_response.filters_list.append(zpk)
+
+        self.m_obj.add_station("mt01", survey="test")
+        run = self.m_obj.add_run("mt01", "a", survey="test")
+        ex = run.from_channel_ts(channel_ts)
+        group = self.filter_group.zpk_group.hdf5_group["pz_run"]
+
+        with self.subTest("compression"):
+            self.assertEqual(
+                group["poles"].compression,
+                self.filter_group.dataset_options["compression"],
+            )
+        with self.subTest("shuffle"):
+            self.assertEqual(
+                group["poles"].shuffle,
+                self.filter_group.dataset_options["shuffle"],
+            )
+        with self.subTest("channel_response"):
+            self.assertTrue(ex.channel_response.filters_list[0] == zpk)
+
     @classmethod
     def tearDownClass(self):
         self.m_obj.close_mth5()
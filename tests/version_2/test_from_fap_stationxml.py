@@ -41,68 +41,35 @@ class TestFAPMTH5(unittest.TestCase):
         self.fn = fn_path.joinpath("from_fap_stationxml.h5")
 
         self.m = MTH5(file_version="0.2.0")
-        self.m.open_mth5(self.fn, mode="a")
-        self.m.from_experiment(self.experiment)
-
-    def test_has_survey(self):
-        self.assertEqual(self.m.has_group(self.base_path), True)
-
-    def test_has_station(self):
-        with self.subTest(name="stations group"):
-            self.assertEqual(
-                self.m.has_group(f"{self.base_path}/Stations"), True
-            )
-        with self.subTest(name="station fl001"):
-            self.assertEqual(
-                self.m.has_group(f"{self.base_path}/Stations/FL001"), True
-            )
-
-    def test_has_run_a(self):
-        self.assertEqual(
-            self.m.has_group(f"{self.base_path}/Stations/FL001/a"), True
-        )
-
-    def test_has_run_b(self):
-        self.assertEqual(
-            self.m.has_group(f"{self.base_path}/Stations/FL001/b"), True
-        )
-
-    def test_has_hx_a(self):
-        self.assertEqual(
-            self.m.has_group(f"{self.base_path}/Stations/FL001/a/hx"), True
-        )
-
-    def test_has_hx_b(self):
-        self.assertEqual(
-            self.m.has_group(f"{self.base_path}/Stations/FL001/b/hx"), True
-        )
-
-    def test_has_fap_table(self):
-
-        self.assertEqual(
-            self.m.has_group(
-                f"{self.base_path}/Filters/fap/frequency response table_00"
-            ),
-            True,
+        self.m.open_mth5(
+            self.fn, mode="a", in_memory=True, libver="latest"
         )
+        self.m.from_experiment(self.experiment)
+        self.hx = self.m.get_channel("FL001", "a", "hx", "test")
 
-    def test_has_coefficient_filter(self):
-        self.assertEqual(
-            self.m.has_group(
-                f"{self.base_path}/Filters/coefficient/v to counts (electric)"
-            ),
-            True,
-        )
+    def test_groups(self):
+        group_set = self.m.group_set()
+        for name in [
+            self.base_path,
+            f"{self.base_path}/Stations",
+            f"{self.base_path}/Stations/FL001",
+            f"{self.base_path}/Stations/FL001/a",
+            f"{self.base_path}/Stations/FL001/b",
+            f"{self.base_path}/Stations/FL001/a/hx",
+            f"{self.base_path}/Stations/FL001/b/hx",
+            f"{self.base_path}/Filters/fap/frequency response table_00",
+            f"{self.base_path}/Filters/coefficient/v to counts (electric)",
+        ]:
+            with self.subTest(name):
+                self.assertIn(name, group_set)
 
     def test_get_channel(self):
-        self.hx = self.m.get_channel("FL001", "a", "hx", "test")
         fnames = [f.name for f in self.hx.channel_response.filters_list]
 
         self.assertIn("frequency response table_00", fnames)
         self.assertIn("v to counts (electric)", fnames)
 
     def test_fap(self):
-        self.hx = self.m.get_channel("FL001", "a", "hx", "test")
         fap = self.hx.channel_response.filters_list[0]
         fap_exp = self.experiment.surveys[0].filters[
             "frequency response table_00"
@@ -120,7 +87,6 @@ class TestFAPMTH5(unittest.TestCase):
             self.assertEqual(getattr(fap, k), getattr(fap_exp, k))
 
     def test_coefficient(self):
-        self.hx = self.m.get_channel("FL001", "a", "hx", "test")
         coeff = self.hx.channel_response.filters_list[1]
         coeff_exp = self.experiment.surveys[0].filters[
             "v to counts (electric)"
@@ -133,4 +99,3 @@ class TestFAPMTH5(unittest.TestCase):
     @classmethod
     def tearDownClass(self):
         self.m.close_mth5()
-        self.fn.unlink()
@@ -78,6 +78,28 @@ class TestMTH5(unittest.TestCase):
     def test_filename(self):
         self.assertIsInstance(self.mth5_obj.filename, Path)
 
+    def test_group_set(self):
+        group_set = self.mth5_obj.group_set()
+        for name in [
+            "Experiment",
+            "Experiment/Surveys",
+            "Experiment/Surveys/test",
+            "Experiment/Surveys/test/Stations",
+            "Experiment/channel_summary",
+        ]:
+            with self.subTest(name):
+                self.assertIn(name, group_set)
+
+    def test_has_group(self):
+        with self.subTest("nested group"):
+            self.assertTrue(self.mth5_obj.has_group("Experiment/Surveys/test"))
+        with self.subTest("dataset"):
+            self.assertTrue(
+                self.mth5_obj.has_group("Experiment/channel_summary")
+            )
+        with self.subTest("missing"):
+            self.assertFalse(self.mth5_obj.has_group("Experiment/Surveys/none"))
+
     def test_is_read(self):
         self.assertEqual(self.mth5_obj.h5_is_read(), True)
 
@@ -498,6 +520,113 @@ class TestMTH5InReadMode(unittest.TestCase):
         self.fn.unlink()
 
 
+class TestMTH5OpenOptions(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.fn = fn_path.joinpath("test_open_options.mth5")
+        self.mth5_obj = MTH5(file_version="0.2.0")
+        self.mth5_obj.open_mth5(self.fn, mode="w")
+        self.mth5_obj.close_mth5()
+
+    def test_chunk_cache_overwrite(self):
+        m = MTH5(file_version="0.2.0")
+        m.open_mth5(
+            self.fn,
+            mode="w",
+            rdcc_nbytes=4 * 1024**2,
+            rdcc_nslots=10007,
+            rdcc_w0=0.5,
+        )
+        h5_file = m.surveys_group.hdf5_group.file
+        cache = h5_file.id.get_access_plist().get_cache()
+        m.close_mth5()
+
+        with self.subTest("nslots"):
+            self.assertEqual(cache[1], 10007)
+        with self.subTest("nbytes"):
+            self.assertEqual(cache[2], 4 * 1024**2)
+        with self.subTest("w0"):
+            self.assertEqual(cache[3], 0.5)
+
+    def test_in_memory(self):
+        fn = fn_path.joinpath("test_in_memory.mth5")
+        m = MTH5(file_version="0.2.0")
+        m.open_mth5(fn, mode="a", in_memory=True)
+        m.add_survey("test")
+        h5_file = m.surveys_group.hdf5_group.file
+
+        with self.subTest("driver"):
+            self.assertEqual(h5_file.driver, "core")
+        with self.subTest("has survey"):
+            self.assertTrue(m.has_group("Experiment/Surveys/test"))
+        m.close_mth5()
+        with self.subTest("not on disk"):
+            self.assertFalse(fn.exists())
+
+    def test_metadata_cache_size(self):
+        for size in [None, 2**27]:
+            m = MTH5(file_version="0.2.0")
+            m.open_mth5(
+                self.fn, mode="w", in_memory=True, metadata_cache_size=size
+            )
+            m.add_survey("test").filters_group
+            h5_file = m.surveys_group.hdf5_group.file
+            initial_size = h5_file.id.get_mdc_config().initial_size
+            m.close_mth5()
+
+            with self.subTest(size=size):
+                if size is None:
+                    self.assertLess(initial_size, 2**27)
+                else:
+                    self.assertEqual(initial_size, size)
+
+    def test_libver(self):
+        m = MTH5(file_version="0.2.0")
+        m.open_mth5(self.fn, mode="w", in_memory=True, libver="latest")
+        h5_file = m.surveys_group.hdf5_group.file
+        libver = h5_file.libver
+        m.close_mth5()
+
+        self.assertNotEqual(libver[0], "earliest")
+
+    def test_chunk_size(self):
+        data = np.arange(2**19, dtype=np.float64)
+        for chunk_size, expected in [(None, (2**17,)), (4096, (4096,))]:
+            m = MTH5(file_version="0.2.0", chunk_size=chunk_size)
+            m.open_mth5(self.fn, mode="w", in_memory=True)
+            m.add_survey("test")
+            m.add_station("mt01", survey="test")
+            m.add_run("mt01", "a", survey="test")
+            ch = m.add_channel("mt01", "a", "ex", "electric", data, survey="test")
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(ch.hdf5_dataset.chunks, expected)
+            with self.subTest("max shape", chunk_size=chunk_size):
+                self.assertEqual(ch.hdf5_dataset.maxshape, (None,))
+            m.close_mth5()
+
+    def test_chunk_size_station_add_run(self):
+        data = np.arange(2**14, dtype=np.float64)
+        m = MTH5(file_version="0.2.0", chunk_size=4096)
+        m.open_mth5(self.fn, mode="w", in_memory=True)
+        survey = m.add_survey("test")
+        station = survey.stations_group.add_station("mt01")
+        run = station.add_run("a")
+        ch = run.add_channel("ex", "electric", data)
+        with self.subTest("add_run"):
+            self.assertEqual(ch.hdf5_dataset.chunks, (4096,))
+
+        station = m.get_survey("test").stations_group.get_station("mt01")
+        ch = station.get_run("a").add_channel("ey", "electric", data)
+        with self.subTest("get_run"):
+            self.assertEqual(ch.hdf5_dataset.chunks, (4096,))
+        m.close_mth5()
+
+    @classmethod
+    def tearDownClass(self):
+        self.mth5_obj.close_mth5()
+        self.fn.unlink()
+
+
 # =============================================================================
 # Run
 # =============================================================================